@@ -29,17 +29,25 @@ def part2_identify_basement_position(floor_directions: str) -> int:
             return idx + 1
 
 
+def parse_input(input_text: str) -> str:
+    return input_text
+
+
+def solve_part1(floor_directions: str) -> int:
+    return part1_calculate_end_floor(floor_directions)
+
+
+def solve_part2(floor_directions: str) -> int:
+    return part2_identify_basement_position(floor_directions)
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    filepath = Path(__file__).resolve()
-    year = filepath.parent.parent.name
-    day = filepath.parent.name
-
-    input_reader = AocInputReader(Path(year, day, INPUT_FILE_NAME))
+    input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     floor_directions = input_reader.read_input_to_str()
     
     part_1 = part1_calculate_end_floor(floor_directions)
@@ -1,8 +1,11 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+
 STARTING_DIAL_POSITION = 50
 
 
@@ -34,21 +37,59 @@ def calculate_number_of_times_dial_passes_zero(instructions: list[int]) -> int:
     dial_position = STARTING_DIAL_POSITION
     zeros = 0
     for instruction in instructions:
-        step = 1 if instruction > 0 else -1
-        for _ in range(abs(instruction)):
-            dial_position = (dial_position + step) % 100
-            if dial_position == 0:
-                zeros += 1
+        # Count the multiples of 100 the dial moves onto, rather than
+        # stepping one click at a time
+        if instruction > 0:
+            zeros += (dial_position + instruction) // 100
+        else:
+            zeros += (dial_position - 1) // 100 - (
+                dial_position + instruction - 1
+            ) // 100
+        dial_position = (dial_position + instruction) % 100
     return zeros
 
 
+def calculate_dial_zeros_numpy(instructions: list[int]) -> tuple[int, int]:
+    """
+    Vectorized version of both parts: returns how many times the dial ends on
+    zero and how many times it passes zero, using NumPy.
+    """
+    import numpy as np
+
+    logger.info("Calculating dial zeros with NumPy")
+    steps = np.asarray(instructions, dtype=np.int64)
+    # Unwrapped dial positions before and after every instruction
+    ends = STARTING_DIAL_POSITION + np.cumsum(steps)
+    starts = np.concatenate(([STARTING_DIAL_POSITION], ends[:-1]))
+
+    ends_on_zero = int(np.count_nonzero(ends % 100 == 0))
+    passes = np.where(
+        steps > 0,
+        ends // 100 - starts // 100,
+        (starts - 1) // 100 - (ends - 1) // 100,
+    )
+    return ends_on_zero, int(passes.sum())
+
+
+def parse_input(input_text: str) -> list[int]:
+    return convert_input_to_signed_integers(input_text)
+
+
+def solve_part1(instructions: list[int]) -> int:
+    return calculate_number_of_times_dial_points_zero(instructions)
+
+
+def solve_part2(instructions: list[int]) -> int:
+    return calculate_number_of_times_dial_passes_zero(instructions)
+
+
 def main():
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    input_reader = AocInputReader("2025/day01/input.txt")
+    input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     input_str = input_reader.read_input_to_str()
     instructions = convert_input_to_signed_integers(input_str)
 
@@ -1,46 +1,120 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
+import itertools
 import logging
-import re
+import math
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+
 
 def split_product_id_ranges(product_id_data: str) -> list[str]:
     """Take the raw data and create a list of ranges (as strings)"""
     return [x.strip() for x in product_id_data.split(",")]
 
 
-def build_product_id_list(product_id_range: str) -> list[str]:
-    """Take the range and create a list of product ids"""
-    starting_point = int(product_id_range.split("-")[0])
-    ending_point = int(product_id_range.split("-")[1])
-    return [str(x) for x in list(range(starting_point, ending_point + 1))]
+def prime_factors(number: int) -> list[int]:
+    """Returns the distinct prime factors of a number"""
+    factors = []
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            factors.append(factor)
+            while number % factor == 0:
+                number //= factor
+        factor += 1
+    if number > 1:
+        factors.append(number)
+    return factors
+
+
+def sum_repeated_block_ids(
+    range_start: int, range_end: int, digit_count: int, block_length: int
+) -> int:
+    """
+    Sums the IDs in [range_start, range_end] with `digit_count` digits that are
+    a block of `block_length` digits repeated.
+
+    Every such ID is block * multiplier, where multiplier is 1 followed by
+    copies of 0...01 (e.g. 1010101 for a 2-digit block repeated 4 times), so
+    the sum is an arithmetic series over the valid blocks.
+    """
+    multiplier = (10**digit_count - 1) // (10**block_length - 1)
+    lowest_block = max(10 ** (block_length - 1), -(-range_start // multiplier))
+    highest_block = min(10**block_length - 1, range_end // multiplier)
+    if lowest_block > highest_block:
+        return 0
+    block_sum = (lowest_block + highest_block) * (highest_block - lowest_block + 1) // 2
+    return block_sum * multiplier
+
 
+def sum_invalid_ids_in_range(range_start: int, range_end: int) -> tuple[int, int]:
+    """
+    Sums the invalid IDs in a range for both parts without enumerating it.
 
-def split_product_id_and_check_for_repetition(product_id: str) -> bool:
-    """Split the product id string in half and check if it repeats"""
-    length = len(product_id)
-    mid = length // 2
-    front = product_id[: mid + (length % 2)]
-    back = product_id[mid + (length % 2) :]
-    if front == back:
-        return True
-    return False
+    Part 1 IDs are a block repeated exactly twice. Part 2 IDs are a block
+    repeated two or more times; an ID whose digits repeat with period p also
+    repeats with every multiple of p dividing its length, so for each length
+    the union over periods is taken by inclusion-exclusion over the largest
+    proper periods (length / prime).
+    """
+    part1_sum = 0
+    part2_sum = 0
+    for digit_count in range(len(str(range_start)), len(str(range_end)) + 1):
+        low = max(range_start, 10 ** (digit_count - 1))
+        high = min(range_end, 10**digit_count - 1)
+        if digit_count % 2 == 0:
+            part1_sum += sum_repeated_block_ids(
+                low, high, digit_count, digit_count // 2
+            )
+
+        primes = prime_factors(digit_count)
+        for subset_size in range(1, len(primes) + 1):
+            sign = 1 if subset_size % 2 else -1
+            for subset in itertools.combinations(primes, subset_size):
+                block_length = digit_count // math.prod(subset)
+                part2_sum += sign * sum_repeated_block_ids(
+                    low, high, digit_count, block_length
+                )
+    return part1_sum, part2_sum
+
+
+def sum_invalid_ids_both_parts(product_id_ranges: list[str]) -> tuple[int, int]:
+    """Sums the invalid IDs for part 1 and part 2 in one pass over the ranges"""
+    logger.info("Summing invalid product IDs for both parts")
+    part1_sum = 0
+    part2_sum = 0
+    for product_id_range in product_id_ranges:
+        range_start, range_end = (int(x) for x in product_id_range.split("-"))
+        range_part1_sum, range_part2_sum = sum_invalid_ids_in_range(
+            range_start, range_end
+        )
+        part1_sum += range_part1_sum
+        part2_sum += range_part2_sum
+    return part1_sum, part2_sum
 
 
 def sum_invalid_ids(product_id_ranges: list[str], part_number: int) -> int:
     logger.info("Summing invalid product IDs")
-    invalid_id_sum = 0
-    for product_id_range in product_id_ranges:
-        product_id_list = build_product_id_list(product_id_range)
-        for product_id in product_id_list:
-            if part_number == 1:
-                if split_product_id_and_check_for_repetition(product_id):
-                    invalid_id_sum += int(product_id)
-            elif part_number == 2:
-                if bool(re.fullmatch(r"(.+)\1+", product_id)):
-                    invalid_id_sum += int(product_id)
-    return invalid_id_sum
+    part1_sum, part2_sum = sum_invalid_ids_both_parts(product_id_ranges)
+    if part_number == 1:
+        return part1_sum
+    elif part_number == 2:
+        return part2_sum
+    return 0
+
+
+def parse_input(input_text: str) -> list[str]:
+    return split_product_id_ranges(input_text)
+
+
+def solve_part1(product_id_ranges: list[str]) -> int:
+    return sum_invalid_ids(product_id_ranges, 1)
+
+
+def solve_part2(product_id_ranges: list[str]) -> int:
+    return sum_invalid_ids(product_id_ranges, 2)
 
 
 def main():
@@ -49,12 +123,13 @@ def main():
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    input_reader = AocInputReader("2025/day02/input.txt")
+    input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     input_str = input_reader.read_input_to_str()
     product_id_ranges = split_product_id_ranges(input_str)
-    part1_invalid_id_sum = sum_invalid_ids(product_id_ranges, 1)
+    part1_invalid_id_sum, part2_invalid_id_sum = sum_invalid_ids_both_parts(
+        product_id_ranges
+    )
     logger.info("Part 1 Solution -- The sum of invalid IDs is %s", part1_invalid_id_sum)
-    part2_invalid_id_sum = sum_invalid_ids(product_id_ranges, 2)
     logger.info("Part 2 Solution -- The sum of invalid IDs is %s", part2_invalid_id_sum)
 
 
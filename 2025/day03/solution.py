@@ -1,41 +1,51 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
 
-class Battery:
-    def __init__(self, joltage: int):
-        self.joltage = joltage
+
+PART1_BATTERY_COUNT = 2
+PART2_BATTERY_COUNT = 12
+BANK_BLOCK_SIZE = 4096
 
 
 class BatteryBank:
-    def __init__(self, batteries: list[Battery]):
-        self.batteries = batteries
+    def __init__(self, joltages: bytes):
+        # One ASCII digit per battery
+        self.joltages = joltages
 
     @staticmethod
     def from_str(battery_bank_str: str):
         """Create BatteryBank from string."""
-        batteries = [Battery(int(char)) for char in battery_bank_str]
-        return BatteryBank(batteries)
+        return BatteryBank(battery_bank_str.encode("ascii"))
+
+    def find_largest_batteries(self, counts: tuple[int, ...]) -> dict[int, int]:
+        """
+        Finds the largest joltage made of n batteries, for every n in counts,
+        in a single pass over the bank.
+
+        Each n keeps a monotonic stack of chosen digits: a smaller digit is
+        dropped whenever a larger one arrives and there are still
+        len(bank) - n drops to spend, so each digit is pushed and popped at
+        most once per n.
+        """
+        stacks = [bytearray() for _ in counts]
+        drops_left = [len(self.joltages) - n for n in counts]
+        for digit in self.joltages:
+            for index, stack in enumerate(stacks):
+                drops = drops_left[index]
+                while drops and stack and stack[-1] < digit:
+                    stack.pop()
+                    drops -= 1
+                drops_left[index] = drops
+                stack.append(digit)
+        return {n: int(stack[:n]) for n, stack in zip(counts, stacks)}
 
     def find_largest_n_batteries(self, n: int) -> int:
-        selected_digits = []
-        search_start = 0
-        joltage_chars = [str(b.joltage) for b in self.batteries]
-        for selection_index in range(n):
-            remaining_needed = n - selection_index - 1
-            search_end = len(joltage_chars) - remaining_needed
-            max_digit = -1
-            max_idx = -1
-            for idx in range(search_start, search_end):
-                digit = int(joltage_chars[idx])
-                if digit > max_digit:
-                    max_digit = digit
-                    max_idx = idx
-            selected_digits.append(max_digit)
-            search_start = max_idx + 1
-        return int("".join(str(d) for d in selected_digits))
+        return self.find_largest_batteries((n,))[n]
 
 
 class EscalatorPowerSupply:
@@ -50,11 +60,104 @@ class EscalatorPowerSupply:
 
     def part1_total(self) -> int:
         """Calculate part 1 total."""
-        return sum(bank.find_largest_n_batteries(2) for bank in self.battery_banks)
+        return sum(
+            bank.find_largest_n_batteries(PART1_BATTERY_COUNT)
+            for bank in self.battery_banks
+        )
+
+    def part2_total(self) -> int:
+        """Calculate part 2 total."""
+        return sum(
+            bank.find_largest_n_batteries(PART2_BATTERY_COUNT)
+            for bank in self.battery_banks
+        )
+
+    def part_totals(self) -> tuple[int, int]:
+        """Calculate part 1 and part 2 totals in a single pass over each bank."""
+        counts = (PART1_BATTERY_COUNT, PART2_BATTERY_COUNT)
+        part1_total = 0
+        part2_total = 0
+        for bank in self.battery_banks:
+            largest = bank.find_largest_batteries(counts)
+            part1_total += largest[PART1_BATTERY_COUNT]
+            part2_total += largest[PART2_BATTERY_COUNT]
+        return part1_total, part2_total
+
+
+class BatchedEscalatorPowerSupply:
+    """
+    NumPy engine for banks that all have the same number of batteries.
+
+    The banks are held as one 2D uint8 array and the greedy digit selection
+    runs for every bank at once: each step takes the leftmost largest digit
+    of every bank's remaining window with a single argmax. Banks are processed
+    in blocks of BANK_BLOCK_SIZE rows to bound temporary memory.
+    """
+
+    def __init__(self, joltages):
+        self.joltages = joltages
+
+    @staticmethod
+    def from_str_list(battery_bank_strs: list[str]):
+        """Create BatchedEscalatorPowerSupply from equal-length strings."""
+        import numpy as np
+
+        bank_width = len(battery_bank_strs[0]) if battery_bank_strs else 0
+        if any(len(s) != bank_width for s in battery_bank_strs):
+            raise ValueError("Battery banks must all have the same length")
+        digits = np.frombuffer("".join(battery_bank_strs).encode("ascii"), np.uint8)
+        joltages = (digits - ord("0")).reshape(len(battery_bank_strs), bank_width)
+        return BatchedEscalatorPowerSupply(joltages)
+
+    def _largest_n_batteries(self, block, n: int):
+        """Returns the largest n-battery joltage of every bank in a block."""
+        import numpy as np
+
+        bank_count, bank_width = block.shape
+        rows = np.arange(bank_count)
+        columns = np.arange(bank_width)
+        search_starts = np.zeros(bank_count, dtype=np.int64)
+        joltage_dtype = np.int64 if n <= 18 else object
+        largest = np.zeros(bank_count, dtype=joltage_dtype)
+        for selection_index in range(n):
+            # Only columns some bank can still choose from need scanning
+            window_start = int(search_starts.min())
+            window_end = bank_width - (n - selection_index - 1)
+            window = block[:, window_start:window_end].astype(np.int8)
+            outside = columns[window_start:window_end] < search_starts[:, None]
+            window[outside] = -1
+            max_idx = window.argmax(axis=1)
+            largest = largest * 10 + window[rows, max_idx].astype(joltage_dtype)
+            search_starts = window_start + max_idx + 1
+        return largest
+
+    def total(self, n: int) -> int:
+        """Sums the largest n-battery joltage over all banks."""
+        total = 0
+        for block_start in range(0, len(self.joltages), BANK_BLOCK_SIZE):
+            block = self.joltages[block_start : block_start + BANK_BLOCK_SIZE]
+            total += sum(self._largest_n_batteries(block, n).tolist())
+        return total
+
+    def part1_total(self) -> int:
+        """Calculate part 1 total."""
+        return self.total(PART1_BATTERY_COUNT)
 
     def part2_total(self) -> int:
         """Calculate part 2 total."""
-        return sum(bank.find_largest_n_batteries(12) for bank in self.battery_banks)
+        return self.total(PART2_BATTERY_COUNT)
+
+
+def parse_input(input_text: str) -> EscalatorPowerSupply:
+    return EscalatorPowerSupply.from_str_list(input_text.split())
+
+
+def solve_part1(escalator_power_supply: EscalatorPowerSupply) -> int:
+    return escalator_power_supply.part1_total()
+
+
+def solve_part2(escalator_power_supply: EscalatorPowerSupply) -> int:
+    return escalator_power_supply.part2_total()
 
 
 def main():
@@ -63,12 +166,11 @@ def main():
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    aoc_input_reader = AocInputReader("2025/day03/input.txt")
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     input_text = aoc_input_reader.read_input_to_str()
     battery_bank_strings = input_text.split()
     escalator_power_supply = EscalatorPowerSupply.from_str_list(battery_bank_strings)
-    part1_result = escalator_power_supply.part1_total()
-    part2_result = escalator_power_supply.part2_total()
+    part1_result, part2_result = escalator_power_supply.part_totals()
     logger.info("Part 1 Solution -- Total output joltage is %d", part1_result)
     logger.info("Part 2 Solution -- Total output joltage is %d", part2_result)
 
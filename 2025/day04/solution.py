@@ -1,19 +1,34 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
+from collections import deque
 import logging
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+
+NEIGHBOR_DIRECTIONS = [
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+]
+MAX_NEIGHBORS_FOR_ACCESS = 3
+
 
 def create_print_dept_grid(input_data: str) -> list[list[str]]:
     return [[char for char in x] for x in input_data.split()]
 
 
 def count_neighboring_paper_rolls(grid: list[list[str]], row: int, column: int) -> int:
-    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
     neighboring_rolls = 0
     number_of_rows = len(grid)
     number_of_columns = len(grid[0])
-    for row_movement, column_movement in directions:
+    for row_movement, column_movement in NEIGHBOR_DIRECTIONS:
         neighbor_row, neighbor_column = row + row_movement, column + column_movement
         if (
             neighbor_row >= 0
@@ -35,30 +50,196 @@ def part1_find_all_accessible_rolls(grid: list[list[str]]) -> int:
             if grid[i][j] != "@":
                 continue
             neighboring_rolls = count_neighboring_paper_rolls(grid, i, j)
-            if neighboring_rolls <= 3:
+            if neighboring_rolls <= MAX_NEIGHBORS_FOR_ACCESS:
                 accessible_rolls += 1
 
     return accessible_rolls
 
 
 def part2_recursively_remove_accessible_rolls(grid: list[list[str]]) -> int:
-    to_remove = []
+    """
+    Removes accessible rolls until none are left and returns how many were
+    removed, leaving the grid without them.
 
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
+    Neighbor counts are computed once. Removing a roll decrements its
+    neighbors' counts, and a roll is queued for removal only when its count
+    first drops to the access limit, so the total work is proportional to
+    the number of rolls rather than waves * cells. The end state does not
+    depend on removal order, so this matches removing the rolls wave by wave.
+    """
+    number_of_rows = len(grid)
+    number_of_columns = len(grid[0]) if grid else 0
+    neighbor_counts = [[0] * number_of_columns for _ in range(number_of_rows)]
+    removal_queue = deque()
+
+    for i in range(number_of_rows):
+        for j in range(number_of_columns):
             if grid[i][j] != "@":
                 continue
-            neighboring_rolls = count_neighboring_paper_rolls(grid, i, j)
-            if neighboring_rolls <= 3:
-                to_remove.append((i, j))
-
-    if not to_remove:
-        return 0
+            neighbor_counts[i][j] = count_neighboring_paper_rolls(grid, i, j)
+            if neighbor_counts[i][j] <= MAX_NEIGHBORS_FOR_ACCESS:
+                removal_queue.append((i, j))
 
-    for i, j in to_remove:
+    removed_rolls = 0
+    while removal_queue:
+        i, j = removal_queue.popleft()
         grid[i][j] = "."
+        removed_rolls += 1
+        for row_movement, column_movement in NEIGHBOR_DIRECTIONS:
+            neighbor_row, neighbor_column = i + row_movement, j + column_movement
+            if not (
+                0 <= neighbor_row < number_of_rows
+                and 0 <= neighbor_column < number_of_columns
+            ):
+                continue
+            if grid[neighbor_row][neighbor_column] != "@":
+                continue
+            neighbor_counts[neighbor_row][neighbor_column] -= 1
+            if (
+                neighbor_counts[neighbor_row][neighbor_column]
+                == MAX_NEIGHBORS_FOR_ACCESS
+            ):
+                removal_queue.append((neighbor_row, neighbor_column))
+
+    return removed_rolls
+
+
+def create_paper_roll_bitrows(input_data: str) -> tuple[list[int], int]:
+    """
+    Alternative grid representation: each row is an int bitmask with a set
+    bit for every roll. Returns the rows and the grid width.
+    """
+    rows = input_data.split()
+    width = len(rows[0]) if rows else 0
+    to_bits = str.maketrans("@.", "10")
+    return [int(row.translate(to_bits), 2) for row in rows], width
+
+
+def find_accessible_bitrow(above: int, row: int, below: int, width: int) -> int:
+    """
+    Returns the rolls in `row` with at most three neighboring rolls, for the
+    whole row at once.
+
+    The eight shifted neighbor masks are summed with bitwise half adders into
+    per-cell counters; only "count >= 4" matters, so the third counter bit
+    saturates instead of carrying further.
+    """
+    mask = (1 << width) - 1
+    neighbors = (
+        (above << 1) & mask,
+        above,
+        above >> 1,
+        (row << 1) & mask,
+        row >> 1,
+        (below << 1) & mask,
+        below,
+        below >> 1,
+    )
+    ones = twos = at_least_four = 0
+    for neighbor in neighbors:
+        carry = ones & neighbor
+        ones ^= neighbor
+        at_least_four |= twos & carry
+        twos ^= carry
+    return row & ~at_least_four
+
+
+def find_accessible_bitrows(rows: list[int], width: int, row_indexes) -> dict[int, int]:
+    """Finds the accessible rolls of the given rows, skipping rows with none."""
+    accessible = {}
+    last_row = len(rows) - 1
+    for i in row_indexes:
+        above = rows[i - 1] if i > 0 else 0
+        below = rows[i + 1] if i < last_row else 0
+        accessible_rolls = find_accessible_bitrow(above, rows[i], below, width)
+        if accessible_rolls:
+            accessible[i] = accessible_rolls
+    return accessible
+
+
+def part1_count_accessible_bitrows(rows: list[int], width: int) -> int:
+    accessible = find_accessible_bitrows(rows, width, range(len(rows)))
+    return sum(accessible_rolls.bit_count() for accessible_rolls in accessible.values())
+
+
+def part2_remove_accessible_bitrows(rows: list[int], width: int) -> int:
+    """
+    Removes accessible rolls wave by wave and returns how many were removed,
+    leaving `rows` without them. Each wave only revisits the rows next to
+    the previous wave's removals.
+    """
+    removed_rolls = 0
+    rows_to_check = range(len(rows))
+    while accessible := find_accessible_bitrows(rows, width, rows_to_check):
+        changed_rows = set()
+        for i, accessible_rolls in accessible.items():
+            rows[i] &= ~accessible_rolls
+            removed_rolls += accessible_rolls.bit_count()
+            changed_rows.update((i - 1, i, i + 1))
+        rows_to_check = sorted(i for i in changed_rows if 0 <= i < len(rows))
+    return removed_rolls
+
+
+def create_paper_roll_array(input_data: str):
+    """NumPy grid representation: a 2D boolean array that is True for rolls."""
+    import numpy as np
+
+    rows = input_data.split()
+    width = len(rows[0]) if rows else 0
+    cells = np.frombuffer("".join(rows).encode("ascii"), dtype=np.uint8)
+    return cells.reshape(len(rows), width) == ord("@")
+
+
+def count_neighboring_paper_rolls_numpy(rolls):
+    """Counts every cell's neighboring rolls at once by summing shifted views."""
+    import numpy as np
+
+    number_of_rows, number_of_columns = rolls.shape
+    padded = np.pad(rolls, 1).view(np.uint8)
+    neighbor_counts = np.zeros(rolls.shape, dtype=np.uint8)
+    for row_movement, column_movement in NEIGHBOR_DIRECTIONS:
+        neighbor_counts += padded[
+            1 + row_movement : 1 + row_movement + number_of_rows,
+            1 + column_movement : 1 + column_movement + number_of_columns,
+        ]
+    return neighbor_counts
+
+
+def part1_count_accessible_rolls_numpy(rolls) -> int:
+    import numpy as np
+
+    neighbor_counts = count_neighboring_paper_rolls_numpy(rolls)
+    accessible = rolls & (neighbor_counts <= MAX_NEIGHBORS_FOR_ACCESS)
+    return int(np.count_nonzero(accessible))
+
+
+def part2_remove_accessible_rolls_numpy(rolls) -> int:
+    """Peels off accessible rolls wave by wave on a copy of the array."""
+    import numpy as np
+
+    rolls = rolls.copy()
+    removed_rolls = 0
+    while True:
+        neighbor_counts = count_neighboring_paper_rolls_numpy(rolls)
+        accessible = rolls & (neighbor_counts <= MAX_NEIGHBORS_FOR_ACCESS)
+        accessible_count = int(np.count_nonzero(accessible))
+        if not accessible_count:
+            return removed_rolls
+        removed_rolls += accessible_count
+        rolls &= ~accessible
+
+
+def parse_input(input_text: str) -> list[list[str]]:
+    return create_print_dept_grid(input_text)
+
+
+def solve_part1(grid: list[list[str]]) -> int:
+    return part1_find_all_accessible_rolls(grid)
+
 
-    return len(to_remove) + part2_recursively_remove_accessible_rolls(grid)
+def solve_part2(grid: list[list[str]]) -> int:
+    # Removal mutates the grid, so work on a copy
+    return part2_recursively_remove_accessible_rolls([row[:] for row in grid])
 
 
 def main():
@@ -67,7 +248,7 @@ def main():
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    aoc_input_reader = AocInputReader("2025/day04/input.txt")
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     input_text = aoc_input_reader.read_input_to_str()
     print_dept_grid = create_print_dept_grid(input_text)
     part1_solution = part1_find_all_accessible_rolls(print_dept_grid)
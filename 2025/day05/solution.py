@@ -1,77 +1,369 @@
 from aoc_helpers.input_reader import AocInputReader
+from aoc_helpers.parse_cache import ParsedInputCache
+from pathlib import Path
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+import argparse
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+
+
+def parse_ingredient_database(
+    input_text: str,
+) -> tuple[list[tuple[int, int]], list[int]]:
+    """Parses the input text into fresh ingredient ranges and available IDs."""
+    split_ranges_and_ids = tuple(x.split() for x in input_text.split("\n\n"))
+
+    fresh_ingredient_ranges = []
+    for ran in split_ranges_and_ids[0]:
+        start = int(ran.split("-")[0])
+        end = int(ran.split("-")[1])
+        fresh_ingredient_ranges.append((start, end))
+
+    available_ingredient_ids = [int(id) for id in split_ranges_and_ids[1]]
+    return fresh_ingredient_ranges, available_ingredient_ids
+
+
+def parse_fresh_range_lines(lines: Iterator[str]) -> list[tuple[int, int]]:
+    """
+    Parses fresh ranges from `lines` up to the blank line that ends the range
+    section, leaving the iterator positioned at the first ingredient ID.
+    """
+    fresh_ingredient_ranges = []
+    for line in lines:
+        if not line.strip():
+            break
+        start, end = line.strip().split("-")
+        fresh_ingredient_ranges.append((int(start), int(end)))
+    return fresh_ingredient_ranges
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merges overlapping ranges into sorted, disjoint ranges."""
+    # Sort ranges by start position
+    sorted_ranges = sorted(ranges, key=lambda x: x[0])
+
+    # Merge overlapping ranges
+    merged_ranges = []
+    for start, end in sorted_ranges:
+        if merged_ranges and start <= merged_ranges[-1][1]:
+            # Overlapping or adjacent - extend the last range
+            merged_ranges[-1] = (
+                merged_ranges[-1][0],
+                max(merged_ranges[-1][1], end),
+            )
+        else:
+            # No overlap - add new range
+            merged_ranges.append((start, end))
+    return merged_ranges
+
 
 class IngredientFreshnessChecker:
-    def __init__(self, input_text: str):
+    def __init__(self, input_text: str | None = None):
         self.fresh_ingredient_ranges: list[tuple[int, int]] = []
         self.available_ingredient_ids: list[int] = []
-        self._parse_input(input_text)
+        self.merged_range_starts: list[int] = []
+        self.merged_range_ends: list[int] = []
+        if input_text is not None:
+            self._parse_input(input_text)
+            self._build_fresh_index()
+
+    @classmethod
+    def from_parsed(
+        cls,
+        fresh_ingredient_ranges: list[tuple[int, int]],
+        available_ingredient_ids: list[int],
+    ) -> "IngredientFreshnessChecker":
+        """Creates a checker from already parsed ranges and IDs."""
+        checker = cls()
+        checker.fresh_ingredient_ranges = fresh_ingredient_ranges
+        checker.available_ingredient_ids = available_ingredient_ids
+        checker._build_fresh_index()
+        return checker
+
+    @classmethod
+    def from_line_stream(cls, lines: Iterator[str]) -> "IngredientFreshnessChecker":
+        """
+        Creates a checker from the range section of a stream of input lines.
+
+        Only the ranges are consumed; the ingredient IDs that follow are left
+        in `lines` for `classify_ingredient_ids`.
+        """
+        return cls.from_parsed(parse_fresh_range_lines(lines), [])
 
     def _parse_input(self, input_text: str) -> None:
         """Parses the input text to populate ranges and IDs."""
-        split_ranges_and_ids = tuple(x.split() for x in input_text.split("\n\n"))
+        self.fresh_ingredient_ranges, self.available_ingredient_ids = (
+            parse_ingredient_database(input_text)
+        )
 
-        for ran in split_ranges_and_ids[0]:
-            start = int(ran.split("-")[0])
-            end = int(ran.split("-")[1])
-            self.fresh_ingredient_ranges.append((start, end))
+    def _build_fresh_index(self) -> None:
+        """Merges the fresh ranges once into sorted starts and ends for lookups."""
+        merged_ranges = merge_ranges(self.fresh_ingredient_ranges)
+        self.merged_range_starts = [start for start, _ in merged_ranges]
+        self.merged_range_ends = [end for _, end in merged_ranges]
 
-        self.available_ingredient_ids = [int(id) for id in split_ranges_and_ids[1]]
+    def is_fresh(self, ingredient: int) -> bool:
+        """Binary searches the merged ranges for the one that could hold the ID."""
+        range_index = bisect_right(self.merged_range_starts, ingredient) - 1
+        return range_index >= 0 and ingredient <= self.merged_range_ends[range_index]
 
     def count_fresh_ingredients(self) -> int:
         """
         Part 1: Counts how many of the available ingredients are fresh.
         """
-        fresh_ingredients = 0
-        for ingredient in self.available_ingredient_ids:
-            for start, end in self.fresh_ingredient_ranges:
-                if start <= ingredient <= end:
-                    fresh_ingredients += 1
-                    break
-        return fresh_ingredients
+        return sum(
+            1
+            for ingredient in self.available_ingredient_ids
+            if self.is_fresh(ingredient)
+        )
+
+    def classify_ingredient_ids(
+        self, id_lines: Iterable[str]
+    ) -> Iterator[tuple[int, bool]]:
+        """Yields (ingredient ID, is fresh) for each ID line as it is read."""
+        for line in id_lines:
+            if line.strip():
+                ingredient = int(line)
+                yield ingredient, self.is_fresh(ingredient)
+
+    def count_fresh_ingredients_numpy(self) -> int:
+        """
+        Part 1 for large inputs: looks up every available ID at once with
+        numpy.searchsorted.
+        """
+        import numpy as np
+
+        if not self.merged_range_starts:
+            return 0
+        starts = np.array(self.merged_range_starts, dtype=np.int64)
+        ends = np.array(self.merged_range_ends, dtype=np.int64)
+        ingredients = np.array(self.available_ingredient_ids, dtype=np.int64)
+        range_indexes = np.searchsorted(starts, ingredients, side="right") - 1
+        in_range = ingredients <= ends[np.maximum(range_indexes, 0)]
+        return int(np.count_nonzero((range_indexes >= 0) & in_range))
 
     def count_total_possible_fresh_ingredients(self) -> int:
         """
         Part 2: Counts how many unique ingredient IDs could possibly be fresh.
         """
-        # Sort ranges by start position
-        sorted_ranges = sorted(self.fresh_ingredient_ranges, key=lambda x: x[0])
-
-        # Merge overlapping ranges
-        merged_ranges = []
-        for start, end in sorted_ranges:
-            if merged_ranges and start <= merged_ranges[-1][1]:
-                # Overlapping or adjacent - extend the last range
-                merged_ranges[-1] = (
-                    merged_ranges[-1][0],
-                    max(merged_ranges[-1][1], end),
-                )
-            else:
-                # No overlap - add new range
-                merged_ranges.append((start, end))
-
         # Count total ingredients in merged ranges
         total_possible_fresh_ingredients = 0
-        for start, end in merged_ranges:
+        for start, end in zip(self.merged_range_starts, self.merged_range_ends):
             num_ingredients = end - start + 1
             total_possible_fresh_ingredients += num_ingredients
 
         return total_possible_fresh_ingredients
 
 
+class DynamicIntervalSet:
+    """
+    A set of fresh ranges that can change over time.
+
+    Ranges are stored in a lazily grown segment tree over [0, 2**value_bits).
+    Each node counts the ranges that cover it entirely and how much of it is
+    covered, so adding or removing a range, checking whether an ID is fresh
+    and reading the total number of fresh IDs (the part 2 answer) each take
+    O(value_bits) steps. Ranges may overlap; removing one only uncovers IDs
+    that no other range covers. Subtrees left empty by a removal go on a free
+    list for reuse, so the tree grows with the live ranges rather than with
+    the update history.
+    """
+
+    def __init__(self, value_bits: int = 64):
+        self.universe_size = 1 << value_bits
+        self.ranges: Counter[tuple[int, int]] = Counter()
+        # Node 0 is the root, so a child index of 0 means "no child"
+        self._left_child = [0]
+        self._right_child = [0]
+        self._cover_count = [0]
+        self._covered_length = [0]
+        self._free_nodes: list[int] = []
+
+    @classmethod
+    def from_ranges(
+        cls, ranges: Iterable[tuple[int, int]], value_bits: int = 64
+    ) -> "DynamicIntervalSet":
+        interval_set = cls(value_bits)
+        for start, end in ranges:
+            interval_set.add_range(start, end)
+        return interval_set
+
+    def add_range(self, start: int, end: int) -> None:
+        """Adds the inclusive range [start, end]."""
+        if not 0 <= start <= end < self.universe_size:
+            raise ValueError(f"Range {start}-{end} is outside the ID space")
+        self.ranges[(start, end)] += 1
+        self._update(0, 0, self.universe_size, start, end, 1)
+
+    def remove_range(self, start: int, end: int) -> None:
+        """Removes one previously added copy of the inclusive range [start, end]."""
+        if not self.ranges[(start, end)]:
+            raise ValueError(f"Range {start}-{end} was never added")
+        self.ranges[(start, end)] -= 1
+        if not self.ranges[(start, end)]:
+            del self.ranges[(start, end)]
+        self._update(0, 0, self.universe_size, start, end, -1)
+
+    def __contains__(self, ingredient: int) -> bool:
+        node, node_start, node_end = 0, 0, self.universe_size
+        while True:
+            if self._cover_count[node]:
+                return True
+            middle = (node_start + node_end) // 2
+            if ingredient < middle:
+                node, node_end = self._left_child[node], middle
+            else:
+                node, node_start = self._right_child[node], middle
+            if not node:
+                return False
+
+    @property
+    def total_covered(self) -> int:
+        """Counts the IDs covered by at least one range."""
+        return self._covered_length[0]
+
+    @property
+    def node_count(self) -> int:
+        """Counts the tree nodes in use, including the root."""
+        return len(self._cover_count) - len(self._free_nodes)
+
+    def _new_node(self) -> int:
+        if self._free_nodes:
+            return self._free_nodes.pop()
+        self._left_child.append(0)
+        self._right_child.append(0)
+        self._cover_count.append(0)
+        self._covered_length.append(0)
+        return len(self._cover_count) - 1
+
+    def _update(
+        self,
+        node: int,
+        node_start: int,
+        node_end: int,
+        start: int,
+        end: int,
+        delta: int,
+    ) -> None:
+        """Adds `delta` to the cover count of the nodes that tile [start, end]."""
+        if start <= node_start and node_end - 1 <= end:
+            self._cover_count[node] += delta
+        else:
+            middle = (node_start + node_end) // 2
+            if start < middle:
+                if not self._left_child[node]:
+                    self._left_child[node] = self._new_node()
+                self._update(
+                    self._left_child[node], node_start, middle, start, end, delta
+                )
+            if end >= middle:
+                if not self._right_child[node]:
+                    self._right_child[node] = self._new_node()
+                self._update(
+                    self._right_child[node], middle, node_end, start, end, delta
+                )
+
+        if self._cover_count[node]:
+            self._covered_length[node] = node_end - node_start
+        else:
+            left_child = self._left_child[node]
+            right_child = self._right_child[node]
+            self._covered_length[node] = (
+                self._covered_length[left_child] if left_child else 0
+            ) + (self._covered_length[right_child] if right_child else 0)
+
+        # A child with nothing covered holds no cover counts anywhere below it
+        for child_links in (self._left_child, self._right_child):
+            child = child_links[node]
+            if child and not self._covered_length[child]:
+                self._free_subtree(child)
+                child_links[node] = 0
+
+    def _free_subtree(self, node: int) -> None:
+        """Resets every node under (and including) `node` and frees it for reuse."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for child_links in (self._left_child, self._right_child):
+                if child_links[node]:
+                    stack.append(child_links[node])
+                    child_links[node] = 0
+            self._cover_count[node] = 0
+            self._covered_length[node] = 0
+            self._free_nodes.append(node)
+
+
+def parse_input(input_text: str) -> IngredientFreshnessChecker:
+    return IngredientFreshnessChecker(input_text)
+
+
+def parse_cached_input(input_reader: AocInputReader) -> IngredientFreshnessChecker:
+    """Like `parse_input`, but loads the parsed database through the cache."""
+    fresh_ingredient_ranges, available_ingredient_ids = (
+        ParsedInputCache().load_or_parse(
+            input_reader, parse_ingredient_database, as_tuple=True
+        )
+    )
+    return IngredientFreshnessChecker.from_parsed(
+        fresh_ingredient_ranges, available_ingredient_ids
+    )
+
+
+def solve_part1(checker: IngredientFreshnessChecker) -> int:
+    return checker.count_fresh_ingredients()
+
+
+def solve_part2(checker: IngredientFreshnessChecker) -> int:
+    return checker.count_total_possible_fresh_ingredients()
+
+
+def stream_main(input_path: str) -> None:
+    """
+    Solves both parts while streaming the ingredient IDs, so memory does not
+    grow with the number of IDs. An input path of "-" reads from stdin.
+    """
+    if input_path == "-":
+        lines = (line.rstrip("\n") for line in sys.stdin)
+    else:
+        lines = AocInputReader(input_path).iter_lines()
+    lines = iter(lines)
+
+    checker = IngredientFreshnessChecker.from_line_stream(lines)
+    fresh_ingredients = sum(
+        is_fresh for _, is_fresh in checker.classify_ingredient_ids(lines)
+    )
+    logger.info("Part 1 Solution -- Available fresh ingredients: %d", fresh_ingredients)
+    fresh_ingredients_possible = checker.count_total_possible_fresh_ingredients()
+    logger.info(
+        "Part 2 Solution -- Total fresh ingredient IDs: %d", fresh_ingredients_possible
+    )
+
+
 def main():
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    aoc_input_reader = AocInputReader("2025/day05/input.txt")
-    input_text = aoc_input_reader.read_input_to_str()
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument(
+        "--stream",
+        metavar="PATH",
+        help="stream ingredient IDs from PATH ('-' for stdin) in constant memory",
+    )
+    args = argument_parser.parse_args()
+    if args.stream is not None:
+        stream_main(args.stream)
+        return
 
-    checker = IngredientFreshnessChecker(input_text)
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
+    checker = parse_cached_input(aoc_input_reader)
 
     fresh_ingredients = checker.count_fresh_ingredients()
     logger.info("Part 1 Solution -- Available fresh ingredients: %d", fresh_ingredients)
@@ -1,9 +1,12 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
 import logging
 import math
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+
 
 def parse_grid(lines):
     """Converts input lines into a grid with uniform width by padding with spaces."""
@@ -115,21 +118,161 @@ def solve(lines, part):
     return grand_total
 
 
+def solve_both_parts(lines):
+    """
+    Solves both parts from a single pass over the transposed worksheet.
+
+    The grid is transposed once so each column is a string: blank columns
+    separate problems, a column's last character is part of the operator row
+    and the rest of it is that column's part 2 number.
+    """
+    grid, height, width = parse_grid(lines)
+    columns = ["".join(column) for column in zip(*grid)]
+    # A trailing blank column closes the last problem
+    columns.append(" " * height)
+
+    grand_totals = [0, 0]
+    group_start = None
+    for col_idx, column in enumerate(columns):
+        if not column.isspace():
+            if group_start is None:
+                group_start = col_idx
+            continue
+        if group_start is None:
+            continue
+
+        group_columns = columns[group_start:col_idx]
+        operator = "".join(c[-1] for c in group_columns).strip() or None
+        part1_numbers = [
+            int(n)
+            for row_idx in range(height - 1)
+            for n in grid[row_idx][group_start:col_idx].split()
+        ]
+        part2_numbers = [
+            int(digits)
+            for group_column in group_columns
+            if (digits := "".join(filter(str.isdigit, group_column[:-1])))
+        ]
+        for part_idx, numbers in enumerate((part1_numbers, part2_numbers)):
+            if operator and numbers:
+                grand_totals[part_idx] += calculate(operator, numbers)
+        group_start = None
+
+    return grand_totals[0], grand_totals[1]
+
+
+def solve_both_parts_numpy(lines):
+    """
+    NumPy engine for very wide worksheets, with the same results as
+    `solve(lines, part)` for both parts.
+
+    The worksheet becomes a 2D uint8 array: blank columns come from a
+    vectorized reduction, problem boundaries from numpy.diff, and numbers are
+    assembled from digit arrays with positional arithmetic. Sums and products
+    are accumulated as Python ints so they stay exact.
+    """
+    import numpy as np
+
+    grid, height, width = parse_grid(lines)
+    if height < 2 or width == 0:
+        return 0, 0
+    chars = np.frombuffer("".join(grid).encode("ascii"), dtype=np.uint8)
+    chars = chars.reshape(height, width)
+    number_rows, operator_row = chars[:-1], chars[-1]
+
+    # Problems are runs of non-blank columns
+    in_problem = (chars != ord(" ")).any(axis=0)
+    edges = np.diff(in_problem.astype(np.int8), prepend=0, append=0)
+    problem_starts = np.flatnonzero(edges == 1)
+    problem_of_column = np.cumsum(edges[:-1] == 1) - 1
+
+    # Operators; anything but exactly one "+" or "*" contributes nothing,
+    # like `calculate`
+    is_operator = operator_row != ord(" ")
+    operator_counts = np.add.reduceat(is_operator, problem_starts)
+    operators = np.maximum.reduceat(operator_row, problem_starts)
+    is_sum = (operator_counts == 1) & (operators == ord("+"))
+    is_product = (operator_counts == 1) & (operators == ord("*"))
+
+    is_digit = (number_rows >= ord("0")) & (number_rows <= ord("9"))
+    digits = number_rows.astype(np.int64) - ord("0")
+    # int64 holds up to 18 digits; longer numbers need Python ints
+    number_dtype = np.int64 if height - 1 <= 18 else object
+
+    def problem_totals(problem_indexes, numbers):
+        """Reduces each problem's numbers with its operator."""
+        number_counts = np.bincount(problem_indexes, minlength=problem_starts.size)
+        sums = np.zeros(problem_starts.size, dtype=object)
+        products = np.ones(problem_starts.size, dtype=object)
+        numbers = numbers.astype(object)
+        np.add.at(sums, problem_indexes, numbers)
+        np.multiply.at(products, problem_indexes, numbers)
+        has_numbers = number_counts > 0
+        return sum(sums[is_sum & has_numbers]) + sum(products[is_product & has_numbers])
+
+    # Part 1: each maximal run of digits in a row is one number
+    row_problems = []
+    row_numbers = []
+    for row_idx in range(height - 1):
+        digit_columns = np.flatnonzero(is_digit[row_idx])
+        if not digit_columns.size:
+            continue
+        run_starts = np.flatnonzero(np.diff(digit_columns, prepend=-2) != 1)
+        run_ends = np.append(run_starts[1:], digit_columns.size) - 1
+        run_lengths = run_ends - run_starts + 1
+        place_values = np.repeat(digit_columns[run_ends], run_lengths) - digit_columns
+        if run_lengths.max() > 18:
+            place_values = place_values.astype(object)
+        weighted_digits = digits[row_idx, digit_columns].astype(
+            place_values.dtype
+        ) * (10**place_values)
+        row_numbers.append(np.add.reduceat(weighted_digits, run_starts))
+        row_problems.append(problem_of_column[digit_columns[run_starts]])
+    part1 = 0
+    if row_numbers:
+        part1 = problem_totals(
+            np.concatenate(row_problems), np.concatenate(row_numbers)
+        )
+
+    # Part 2: each column's digits, read top to bottom, form one number
+    column_numbers = np.zeros(width, dtype=number_dtype)
+    for row_idx in range(height - 1):
+        column_numbers = np.where(
+            is_digit[row_idx],
+            column_numbers * 10 + digits[row_idx].astype(number_dtype),
+            column_numbers,
+        )
+    number_columns = np.flatnonzero(is_digit.any(axis=0))
+    part2 = problem_totals(
+        problem_of_column[number_columns], column_numbers[number_columns]
+    )
+
+    return int(part1), int(part2)
+
+
+def parse_input(input_text: str) -> list[str]:
+    return input_text.splitlines()
+
+
+def solve_part1(lines: list[str]) -> int:
+    return solve(lines, part=1)
+
+
+def solve_part2(lines: list[str]) -> int:
+    return solve(lines, part=2)
+
+
 def main():
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    aoc_input_reader = AocInputReader("2025/day06/input.txt")
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     lines = aoc_input_reader.read_input_to_str().splitlines()
 
-    # Part 1
-    grand_total_part1 = solve(lines, part=1)
+    grand_total_part1, grand_total_part2 = solve_both_parts(lines)
     logger.info("Part 1 Solution -- Grand total: %d", grand_total_part1)
-
-    # Part 2
-    grand_total_part2 = solve(lines, part=2)
     logger.info("Part 2 Solution -- Grand total: %d", grand_total_part2)
 
 
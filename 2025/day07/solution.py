@@ -1,8 +1,17 @@
 from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
+import argparse
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+# A cell receives timelines from at most three cells of the row above (straight
+# down and from a splitter on either side), so int64 counts are safe while the
+# largest one stays below a third of the int64 maximum
+MAX_INT64_TIMELINE_COUNT = (2**63 - 1) // 3
+
 
 def create_tachyon_manifold_diagram(input_text: str) -> list[list[str]]:
     return [[x for x in y] for y in input_text.splitlines()]
@@ -106,22 +115,130 @@ def count_quantum_timelines(grid: list[list[str]]) -> int:
     return total_timelines
 
 
+def count_quantum_timelines_numpy(grid: list[list[str]]) -> int:
+    """
+    Same count as `count_quantum_timelines`, propagating one row's timeline
+    vector to the next with shifted array adds.
+
+    Counts start as int64 and switch to Python ints (object arrays) as soon
+    as another row could overflow them, so the result is exact.
+    """
+    import numpy as np
+
+    rows = len(grid)
+    columns = len(grid[0]) if grid else 0
+    start_row, start_col = find_start_position(grid)
+    cells = np.frombuffer(
+        "".join("".join(row) for row in grid).encode("ascii"), dtype=np.uint8
+    ).reshape(rows, columns)
+
+    timeline_counts = np.zeros(columns, dtype=np.int64)
+    timeline_counts[start_col] = 1
+    for row in cells[start_row : rows - 1]:
+        if (
+            timeline_counts.dtype != object
+            and timeline_counts.max() > MAX_INT64_TIMELINE_COUNT
+        ):
+            timeline_counts = timeline_counts.astype(object)
+        is_splitter = row == ord("^")
+        split_counts = np.where(is_splitter, timeline_counts, 0)
+        timeline_counts = np.where(is_splitter, 0, timeline_counts)
+        timeline_counts[:-1] += split_counts[1:]
+        timeline_counts[1:] += split_counts[:-1]
+
+    # Summing as Python ints keeps the total exact even when the counts fit
+    return sum(timeline_counts.tolist())
+
+
+def count_splits_and_timelines(diagram_rows) -> tuple[int, int]:
+    """
+    Counts the beam splits (part 1) and quantum timelines (part 2) in one pass.
+
+    Only the active beam columns are carried from row to row, each with the
+    number of timelines reaching it, so the work per row is proportional to
+    the number of beams rather than the width of the manifold. `diagram_rows`
+    may be any iterable of rows (strings or lists of characters).
+    """
+    split_count = 0
+    beams = None
+    for row in diagram_rows:
+        if beams is None:
+            if "S" in row:
+                beams = {row.index("S"): 1}
+                incoming_beams = beams
+            continue
+
+        incoming_beams = beams
+        beams = {}
+        columns = len(row)
+        for column, timelines in incoming_beams.items():
+            if column < columns and row[column] == "^":
+                split_count += 1
+                if column - 1 >= 0:
+                    beams[column - 1] = beams.get(column - 1, 0) + timelines
+                if column + 1 < columns:
+                    beams[column + 1] = beams.get(column + 1, 0) + timelines
+            else:
+                beams[column] = beams.get(column, 0) + timelines
+
+    if beams is None:
+        raise ValueError("No starting position 'S' found in grid")
+    # Timelines reaching the last row exit the manifold, split or not
+    return split_count, sum(incoming_beams.values())
+
+
+def parse_input(input_text: str) -> list[list[str]]:
+    return create_tachyon_manifold_diagram(input_text)
+
+
+def solve_part1(grid: list[list[str]]) -> int:
+    split_count, _ = count_splits_and_timelines(grid)
+    return split_count
+
+
+def solve_part2(grid: list[list[str]]) -> int:
+    _, timeline_count = count_splits_and_timelines(grid)
+    return timeline_count
+
+
+def stream_main(input_path: str) -> None:
+    """
+    Solves both parts while streaming the diagram row by row, so memory only
+    grows with the width of the manifold. An input path of "-" reads from
+    stdin.
+    """
+    if input_path == "-":
+        diagram_rows = (line.rstrip("\n") for line in sys.stdin)
+    else:
+        diagram_rows = AocInputReader(input_path).iter_lines()
+
+    part1, part2 = count_splits_and_timelines(diagram_rows)
+    logger.info("Part 1 Solution -- Number of splits: %d", part1)
+    logger.info("Part 2 Solution -- Number of timelines: %d", part2)
+
+
 def main():
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    aoc_input_reader = AocInputReader("2025/day07/input.txt")
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument(
+        "--stream",
+        metavar="PATH",
+        help="stream the diagram from PATH ('-' for stdin) in O(width) memory",
+    )
+    args = argument_parser.parse_args()
+    if args.stream is not None:
+        stream_main(args.stream)
+        return
+
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
     input_text = aoc_input_reader.read_input_to_str()
 
-    grid = create_tachyon_manifold_diagram(input_text)
-    split_grid = simulate_beam_splitting(grid)
-    part1 = identify_splits_in_grid(split_grid)
+    part1, part2 = count_splits_and_timelines(input_text.splitlines())
     logger.info("Part 1 Solution -- Number of splits: %d", part1)
-
-    grid2 = create_tachyon_manifold_diagram(input_text)
-    part2 = count_quantum_timelines(grid2)
     logger.info("Part 2 Solution -- Number of timelines: %d", part2)
 
 
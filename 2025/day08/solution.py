@@ -1,9 +1,18 @@
 from aoc_helpers.input_reader import AocInputReader
+from aoc_helpers.parse_cache import ParsedInputCache
+from pathlib import Path
+import heapq
+import itertools
 import logging
+import math
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+INPUT_FILE_NAME = "input.txt"
+# Pairwise distances computed per block by the NumPy engine (about 32 MiB each)
+DISTANCE_BLOCK_ELEMENTS = 1 << 22
+
 
 def parse_junction_box_positions(input_text: str) -> list[tuple[int, int, int]]:
     """Convert input text to list of coordinates"""
@@ -78,23 +87,249 @@ def build_all_possible_connections(
     return possible_connections
 
 
+def find_closest_connections_numpy(
+    junction_box_positions: list[tuple[int, int, int]],
+    number_of_connections: int,
+    block_elements: int = DISTANCE_BLOCK_ELEMENTS,
+) -> list[tuple[int, int, int]]:
+    """
+    Returns the first `number_of_connections` entries of
+    `build_all_possible_connections` using NumPy.
+
+    The upper triangle of the distance matrix is computed in row blocks of
+    about `block_elements` int64 values. Only a running top-k is kept: each
+    block is cut down with argpartition, and the survivors are merged with the
+    previous best using lexsort on (dist2, i, j), so ties break the same way
+    as the tuple sort.
+    """
+    import numpy as np
+
+    positions = np.array(junction_box_positions, dtype=np.int64).reshape(-1, 3)
+    total_boxes = len(positions)
+    if number_of_connections <= 0 or total_boxes < 2:
+        return []
+
+    best_dist2 = np.empty(0, dtype=np.int64)
+    best_i = np.empty(0, dtype=np.int64)
+    best_j = np.empty(0, dtype=np.int64)
+    rows_per_block = max(1, block_elements // total_boxes)
+    for block_start in range(0, total_boxes - 1, rows_per_block):
+        block_end = min(block_start + rows_per_block, total_boxes - 1)
+        # Columns start after the block's first row; pairs with j <= i are
+        # masked out below
+        column_start = block_start + 1
+        block_shape = (block_end - block_start, total_boxes - column_start)
+        dist2 = np.zeros(block_shape, dtype=np.int64)
+        for axis in range(3):
+            differences = np.subtract.outer(
+                positions[block_start:block_end, axis], positions[column_start:, axis]
+            )
+            dist2 += differences * differences
+        # Only the block's leading square holds pairs with j <= i
+        triangle = dist2[:, : block_end - block_start]
+        triangle[np.tril_indices_from(triangle, -1)] = np.iinfo(np.int64).max
+        dist2 = dist2.ravel()
+
+        # Keep every pair tied with the cutoff so lexsort can break ties
+        if best_dist2.size == number_of_connections:
+            candidates = np.flatnonzero(dist2 <= best_dist2[-1])
+        elif dist2.size > number_of_connections:
+            cutoff = np.partition(dist2, number_of_connections - 1)[
+                number_of_connections - 1
+            ]
+            candidates = np.flatnonzero(dist2 <= cutoff)
+        else:
+            candidates = np.arange(dist2.size)
+        row_offsets, column_offsets = np.divmod(candidates, total_boxes - column_start)
+        candidate_i = row_offsets + block_start
+        candidate_j = column_offsets + column_start
+        valid = candidate_j > candidate_i
+
+        best_dist2 = np.concatenate((best_dist2, dist2[candidates][valid]))
+        best_i = np.concatenate((best_i, candidate_i[valid]))
+        best_j = np.concatenate((best_j, candidate_j[valid]))
+        order = np.lexsort((best_j, best_i, best_dist2))[:number_of_connections]
+        best_dist2, best_i, best_j = best_dist2[order], best_i[order], best_j[order]
+
+    return list(zip(best_dist2.tolist(), best_i.tolist(), best_j.tolist()))
+
+
+class JunctionBoxGrid:
+    """
+    Uniform 3D grid of buckets over the junction boxes that yields pairs of
+    boxes lazily in increasing distance.
+
+    Each box searches outward ring by ring (the shell of cells at Chebyshev
+    distance r from its own cell) and releases a pair once no box in an
+    unsearched ring could be closer. The per-box streams are merged with a
+    heap, so only the pairs actually consumed are ever built.
+    """
+
+    def __init__(self, junction_box_positions: list[tuple[int, int, int]]):
+        self.junction_box_positions = junction_box_positions
+        if not junction_box_positions:
+            self.origin = (0, 0, 0)
+            self.cell_size = 1
+            self.grid_dimensions = (0, 0, 0)
+            self.buckets = {}
+            return
+
+        self.origin = tuple(min(axis) for axis in zip(*junction_box_positions))
+        extents = [
+            max(axis) - low + 1
+            for axis, low in zip(zip(*junction_box_positions), self.origin)
+        ]
+        self.cell_size = self._choose_cell_size(extents, len(junction_box_positions))
+        self.grid_dimensions = tuple(
+            -(-extent // self.cell_size) for extent in extents
+        )
+
+        self.buckets: dict[tuple[int, int, int], list[int]] = {}
+        for box_index, position in enumerate(junction_box_positions):
+            self.buckets.setdefault(self._cell_of(position), []).append(box_index)
+
+    @staticmethod
+    def _choose_cell_size(extents: list[int], total_boxes: int) -> int:
+        """
+        Returns the smallest cell size that gives at most one cell per box.
+
+        Sizing by the total cell count rather than the bounding-box volume
+        keeps flat or collinear inputs from getting thousands of cells along
+        an axis: a degenerate axis simply ends up one cell wide.
+        """
+        low, high = 1, max(extents)
+        while low < high:
+            cell_size = (low + high) // 2
+            cell_count = math.prod(-(-extent // cell_size) for extent in extents)
+            if cell_count <= total_boxes:
+                high = cell_size
+            else:
+                low = cell_size + 1
+        return low
+
+    def _cell_of(self, position: tuple[int, int, int]) -> tuple[int, int, int]:
+        return tuple(
+            (coordinate - low) // self.cell_size
+            for coordinate, low in zip(position, self.origin)
+        )
+
+    def _count_cube_cells(self, cell: tuple[int, int, int], ring: int) -> int:
+        """Counts the in-bounds cells within Chebyshev distance `ring` of `cell`."""
+        return math.prod(
+            min(center + ring, dimension - 1) - max(center - ring, 0) + 1
+            for center, dimension in zip(cell, self.grid_dimensions)
+        )
+
+    def _iter_ring_cells(self, cell: tuple[int, int, int], ring: int):
+        """
+        Yields the in-bounds cells at Chebyshev distance `ring` from `cell`,
+        one face of the shell at a time so out-of-bounds faces cost nothing.
+        """
+        if ring == 0:
+            yield cell
+            return
+        (cx, cy, cz), (nx, ny, nz) = cell, self.grid_dimensions
+
+        def span(center, dimension, radius):
+            return range(
+                max(center - radius, 0), min(center + radius, dimension - 1) + 1
+            )
+
+        def faces(center, dimension):
+            return [c for c in (center - ring, center + ring) if 0 <= c < dimension]
+
+        for x in faces(cx, nx):
+            for y in span(cy, ny, ring):
+                for z in span(cz, nz, ring):
+                    yield (x, y, z)
+        for y in faces(cy, ny):
+            for x in span(cx, nx, ring - 1):
+                for z in span(cz, nz, ring):
+                    yield (x, y, z)
+        for z in faces(cz, nz):
+            for x in span(cx, nx, ring - 1):
+                for y in span(cy, ny, ring - 1):
+                    yield (x, y, z)
+
+    def iter_box_connections(self, box_index: int):
+        """
+        Yields (dist2, box_index, j) for every j > box_index in increasing
+        order.
+
+        After rings 0..r have been searched, every other box is more than
+        r * cell_size away along some axis, so pending pairs no longer than
+        that are final. Once the rings would cover more cells than there are
+        occupied buckets, the remaining buckets are scanned directly instead.
+        """
+        position = self.junction_box_positions[box_index]
+        cell = self._cell_of(position)
+        last_ring = max(self.grid_dimensions)
+        pending: list[tuple[int, int, int]] = []
+
+        def add_pending(bucket):
+            for other_index in bucket:
+                if other_index > box_index:
+                    dist2 = squared_straight_line_distance(
+                        position, self.junction_box_positions[other_index]
+                    )
+                    heapq.heappush(pending, (dist2, box_index, other_index))
+
+        for ring in itertools.count():
+            if self._count_cube_cells(cell, ring) > len(self.buckets):
+                for bucket_cell, bucket in self.buckets.items():
+                    distance = max(abs(a - b) for a, b in zip(bucket_cell, cell))
+                    if distance >= ring:
+                        add_pending(bucket)
+                searched_everything = True
+            else:
+                for ring_cell in self._iter_ring_cells(cell, ring):
+                    add_pending(self.buckets.get(ring_cell, ()))
+                searched_everything = ring >= last_ring
+
+            if searched_everything:
+                while pending:
+                    yield heapq.heappop(pending)
+                return
+            certified_dist2 = (ring * self.cell_size) ** 2
+            while pending and pending[0][0] <= certified_dist2:
+                yield heapq.heappop(pending)
+
+    def iter_connections(self):
+        """
+        Yields every pair as (dist2, i, j) with i < j, in the same order as
+        `build_all_possible_connections`.
+        """
+        return heapq.merge(
+            *(
+                self.iter_box_connections(box_index)
+                for box_index in range(len(self.junction_box_positions))
+            )
+        )
+
+
 def connect_closest_circuits(
     junction_box_positions: list[tuple[int, int, int]],
     number_of_pairs_to_process: int,
+    connections=None,
 ) -> list[int]:
-    """Processes the first N closest pairs"""
+    """
+    Processes the first N closest pairs
+
+    `connections` may supply the pairs as (dist2, i, j) in increasing order,
+    e.g. from `find_closest_connections_numpy`; by default they come from a
+    `JunctionBoxGrid`.
+    """
     total_boxes = len(junction_box_positions)
 
     circuit_parent = list(range(total_boxes))
     circuit_size = [1] * total_boxes
 
-    possible_connections = build_all_possible_connections(junction_box_positions)
+    if connections is None:
+        connections = JunctionBoxGrid(junction_box_positions).iter_connections()
+    closest_connections = itertools.islice(connections, number_of_pairs_to_process)
 
     # Only process the first N PAIRS — not successful unions
-    pairs_to_process = min(number_of_pairs_to_process, len(possible_connections))
-
-    for k in range(pairs_to_process):
-        _, box_a, box_b = possible_connections[k]
+    for _, box_a, box_b in closest_connections:
         connect_circuits_if_needed(
             circuit_parent,
             circuit_size,
@@ -135,10 +370,11 @@ def find_last_connection_for_full_circuit(
     circuit_parent = list(range(total_boxes))
     circuit_size = [1] * total_boxes
 
-    # Build all possible connections, sorted by distance
-    possible_connections = build_all_possible_connections(junction_box_positions)
+    # Connections are generated lazily, in order of distance
+    possible_connections = JunctionBoxGrid(junction_box_positions).iter_connections()
 
     last_connection = None
+    remaining_circuits = total_boxes
 
     for _, box_a, box_b in possible_connections:
         root_a = find_circuit_root(circuit_parent, box_a)
@@ -151,10 +387,9 @@ def find_last_connection_for_full_circuit(
         connect_circuits_if_needed(circuit_parent, circuit_size, box_a, box_b)
         last_connection = (box_a, box_b)
 
-        # Check if everything is now in one circuit
-        # all roots should be the same
-        root_set = {find_circuit_root(circuit_parent, i) for i in range(total_boxes)}
-        if len(root_set) == 1:
+        # Every union merges two circuits into one
+        remaining_circuits -= 1
+        if remaining_circuits == 1:
             break
 
     if last_connection is None:
@@ -164,6 +399,27 @@ def find_last_connection_for_full_circuit(
     return junction_box_positions[box_a][0] * junction_box_positions[box_b][0]
 
 
+def parse_input(input_text: str) -> list[tuple[int, int, int]]:
+    return parse_junction_box_positions(input_text)
+
+
+def parse_cached_input(input_reader: AocInputReader) -> list[tuple[int, int, int]]:
+    """Like `parse_input`, but loads the positions through the parsed input cache."""
+    return ParsedInputCache().load_or_parse(input_reader, parse_junction_box_positions)
+
+
+def solve_part1(junction_box_positions: list[tuple[int, int, int]]) -> int:
+    circuit_parent = connect_closest_circuits(
+        junction_box_positions,
+        number_of_pairs_to_process=1000,
+    )
+    return compute_three_largest_circuit_product(circuit_parent)
+
+
+def solve_part2(junction_box_positions: list[tuple[int, int, int]]) -> int:
+    return find_last_connection_for_full_circuit(junction_box_positions)
+
+
 def main():
     logging.basicConfig(
         level=logging.INFO,
@@ -171,10 +427,8 @@ def main():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    aoc_input_reader = AocInputReader("2025/day08/input.txt")
-    input_text = aoc_input_reader.read_input_to_str()
-
-    junction_box_positions = parse_junction_box_positions(input_text)
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
+    junction_box_positions = parse_cached_input(aoc_input_reader)
 
     circuit_parent = connect_closest_circuits(
         junction_box_positions,
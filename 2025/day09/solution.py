@@ -1,4 +1,11 @@
 from aoc_helpers.input_reader import AocInputReader
+from aoc_helpers.parse_cache import ParsedInputCache
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+INPUT_FILE_NAME = "input.txt"
 
 
 def parse_input_to_coordinates(input: str) -> list[tuple[int, int]]:
@@ -56,7 +63,10 @@ def generate_red_green_grid(red_tiles):
             for idx_x in range(min(idx_x1, idx_x2), max(idx_x1, idx_x2) + 1):
                 grid[idx_y1][idx_x] = 1
         else:
-            print(f"ERROR: Tile {i} at ({x1},{y1}) doesn't connect straight to tile {(i+1)%n} at ({x2},{y2})")
+            logger.error(
+                "Tile %d at (%d,%d) doesn't connect straight to tile %d at (%d,%d)",
+                i, x1, y1, (i + 1) % n, x2, y2,
+            )
             raise ValueError("Red tiles only connect in straight lines")
 
     return grid, 0, 0
@@ -178,18 +188,41 @@ def max_rectangle_area_part2(red_tiles):
     return max_area
 
 
+def parse_input(input_text: str) -> list[tuple[int, int]]:
+    return parse_input_to_coordinates(input_text)
+
+
+def parse_cached_input(input_reader: AocInputReader) -> list[tuple[int, int]]:
+    """Like `parse_input`, but loads the tiles through the parsed input cache."""
+    return ParsedInputCache().load_or_parse(input_reader, parse_input_to_coordinates)
+
+
+def solve_part1(red_tiles: list[tuple[int, int]]) -> int:
+    return max_rectangle_area_part1(red_tiles)
+
+
+def solve_part2(red_tiles: list[tuple[int, int]]) -> int:
+    return max_rectangle_area_part2(red_tiles)
+
+
 def main():
-    aoc_input_reader = AocInputReader("2025/day09/input.txt")
-    input_text = aoc_input_reader.read_input_to_str()
-    red_tiles = parse_input_to_coordinates(input_text)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
+    red_tiles = parse_cached_input(aoc_input_reader)
 
     # Part 1
     max_area_part1 = max_rectangle_area_part1(red_tiles)
-    print("Part 1:", max_area_part1)
+    logger.info("Part 1 Solution -- Largest red rectangle area: %d", max_area_part1)
 
     # Part 2
     max_area_part2 = max_rectangle_area_part2(red_tiles)
-    print("Part 2:", max_area_part2)
+    logger.info(
+        "Part 2 Solution -- Largest red and green rectangle area: %d", max_area_part2
+    )
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
-from aoc_helpers.input_reader import AocInputReader
+from aoc_helpers.input_reader import AocInputReader, MappedInput
+from aoc_helpers.parse_cache import ParsedInputCache
 
-__all__ = ["AocInputReader"]
+__all__ = ["AocInputReader", "MappedInput", "ParsedInputCache"]
@@ -0,0 +1,225 @@
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from aoc_helpers.bench import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_REPEATS,
+    DEFAULT_RESULTS_PATH,
+    DEFAULT_THRESHOLD,
+    benchmark_day,
+    benchmark_key,
+    find_regressions,
+    log_day_benchmark,
+    read_results,
+    write_results,
+)
+from aoc_helpers.generators import GENERATORS, write_generated_input
+from aoc_helpers.runner import (
+    INPUT_FILE_NAME,
+    day_directory,
+    discover_days,
+    log_day_result,
+    log_run_summary,
+    run_day,
+    run_days_in_parallel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def add_day_selection_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument("year", type=int)
+    subparser.add_argument(
+        "day", type=int, nargs="?", help="day to select (default: every day)"
+    )
+    input_group = subparser.add_mutually_exclusive_group()
+    input_group.add_argument("--input", help="input file to use instead of input.txt")
+    input_group.add_argument(
+        "--generate",
+        type=int,
+        metavar="SIZE",
+        help="use a generated input of this size instead of input.txt",
+    )
+    subparser.add_argument(
+        "--seed", type=int, default=0, help="seed for --generate (default: 0)"
+    )
+    subparser.add_argument(
+        "--root", default=".", help="repository root containing the YEAR directories"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc_helpers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run solutions and time each stage")
+    add_day_selection_arguments(run_parser)
+    run_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="run days in a process pool instead of one after another",
+    )
+    run_parser.add_argument(
+        "--jobs", type=int, help="number of worker processes (default: CPU count)"
+    )
+    run_parser.add_argument(
+        "--split-parts",
+        action="store_true",
+        help="with --parallel, also run each day's parts in separate workers",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark solutions and compare against a baseline"
+    )
+    add_day_selection_arguments(bench_parser)
+    bench_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    bench_parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_RESULTS_PATH,
+        help="where to write the JSON results",
+    )
+    bench_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction of the baseline (default: 0.1)",
+    )
+    bench_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="write the results as the new baseline instead of comparing",
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write a deterministic synthetic input"
+    )
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("size", type=int)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def select_days(args, parser) -> list[int]:
+    if args.day is not None:
+        return [args.day]
+    if args.input is not None:
+        parser.error("--input requires a day")
+    days = discover_days(args.root, args.year)
+    if not days:
+        parser.error(f"no solutions found for {args.year}")
+    return days
+
+
+def check_generators_exist(year: int, days: list[int], parser) -> None:
+    missing_days = [day for day in days if (year, day) not in GENERATORS]
+    if missing_days:
+        parser.error(
+            f"no input generator for {year} day(s) "
+            + ", ".join(f"{day:02d}" for day in missing_days)
+        )
+
+
+def resolve_input_paths(args, days: list[int], parser) -> dict[int, Path | None]:
+    """Maps each selected day to its --input or --generate input, if any."""
+    if args.generate is not None:
+        check_generators_exist(args.year, days, parser)
+        return {
+            day: write_generated_input(args.year, day, args.generate, args.seed)
+            for day in days
+        }
+    return {day: args.input for day in days}
+
+
+def run_command(args, parser) -> None:
+    if not args.parallel and (args.jobs is not None or args.split_parts):
+        parser.error("--jobs and --split-parts require --parallel")
+    days = select_days(args, parser)
+    input_paths = resolve_input_paths(args, days, parser)
+
+    start = time.perf_counter()
+    if args.parallel:
+        results = run_days_in_parallel(
+            args.root,
+            args.year,
+            days,
+            input_paths=input_paths,
+            max_workers=args.jobs,
+            split_parts=args.split_parts,
+        )
+        for result in results:
+            log_day_result(result)
+    else:
+        results = []
+        for day in days:
+            result = run_day(args.root, args.year, day, input_path=input_paths[day])
+            log_day_result(result)
+            results.append(result)
+    log_run_summary(results, time.perf_counter() - start)
+
+
+def bench_command(args, parser) -> None:
+    days = select_days(args, parser)
+    input_paths = resolve_input_paths(args, days, parser)
+
+    results = {}
+    for day in days:
+        input_path = input_paths[day] or (
+            day_directory(args.root, args.year, day) / INPUT_FILE_NAME
+        )
+        key = benchmark_key(args.year, day, input_path)
+        logger.info("Benchmarking %s on %s", key, input_path)
+        results[key] = benchmark_day(
+            args.root,
+            args.year,
+            day,
+            input_path=input_path,
+            repeats=args.repeats,
+        )
+        log_day_benchmark(key, results[key])
+    write_results(results, args.output)
+
+    if args.save_baseline:
+        baseline = read_results(args.baseline) if args.baseline.exists() else {}
+        baseline.update(results)
+        write_results(baseline, args.baseline)
+        return
+
+    if not args.baseline.exists():
+        logger.info("No baseline at %s, skipping comparison", args.baseline)
+        return
+    baseline = read_results(args.baseline)
+    for key in sorted(results.keys() - baseline.keys()):
+        logger.info("No baseline for %s on this input, skipping comparison", key)
+    regressions = find_regressions(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        logger.warning("Regression -- %s", regression)
+    if regressions:
+        sys.exit(1)
+    logger.info("No regressions against %s", args.baseline)
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.command == "run":
+        run_command(args, parser)
+    elif args.command == "bench":
+        bench_command(args, parser)
+    elif args.command == "generate":
+        check_generators_exist(args.year, [args.day], parser)
+        write_generated_input(args.year, args.day, args.size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
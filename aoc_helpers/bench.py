@@ -0,0 +1,154 @@
+import json
+import logging
+import math
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from aoc_helpers.input_reader import AocInputReader
+from aoc_helpers.parse_cache import hash_input_file
+from aoc_helpers.runner import (
+    CACHED_PARSE_STAGE,
+    INPUT_FILE_NAME,
+    day_directory,
+    load_solution_module,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_BASELINE_PATH = Path("benchmarks", "baseline.json")
+DEFAULT_RESULTS_PATH = Path("benchmarks", "latest.json")
+BENCHMARKED_STAGES = ("parse_input", "solve_part1", "solve_part2")
+CACHED_LOAD_STAGE = "load_cached_input"
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def benchmark_function(function, argument, repeats: int) -> dict[str, float]:
+    """
+    Times `function(argument)` over repeated runs.
+
+    Peak memory is measured in one extra traced run so that tracemalloc's
+    overhead does not skew the timings.
+    """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(argument)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function(argument)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "peak_memory": peak_memory,
+        "repeats": repeats,
+    }
+
+
+def benchmark_day(
+    root, year: int, day: int, input_path=None, repeats: int = DEFAULT_REPEATS
+) -> dict[str, dict[str, float]]:
+    """
+    Benchmarks the parse and part stages of one day's solution.
+
+    Days that define `parse_cached_input` also get a "load_cached_input"
+    stage, timed after the cache has been warmed, so every sample measures
+    a cache hit. "parse_input" always times the real parser.
+    """
+    module = load_solution_module(root, year, day)
+    if input_path is None:
+        input_path = day_directory(root, year, day) / INPUT_FILE_NAME
+    input_reader = AocInputReader(input_path)
+    input_text = input_reader.read_input_to_str()
+    parsed = module.parse_input(input_text)
+
+    results = {}
+    for stage in BENCHMARKED_STAGES:
+        argument = input_text if stage == "parse_input" else parsed
+        logger.info("Benchmarking %d day %02d %s", year, day, stage)
+        results[stage] = benchmark_function(getattr(module, stage), argument, repeats)
+
+    if hasattr(module, CACHED_PARSE_STAGE):
+        load_cached_input = getattr(module, CACHED_PARSE_STAGE)
+        load_cached_input(input_reader)
+        logger.info("Benchmarking %d day %02d %s", year, day, CACHED_LOAD_STAGE)
+        results[CACHED_LOAD_STAGE] = benchmark_function(
+            load_cached_input, input_reader, repeats
+        )
+    return results
+
+
+def benchmark_key(year: int, day: int, input_path) -> str:
+    """
+    Keys results by day and input content, e.g. "2025/day08@3f2a9c0e1b7d4a65",
+    so runs on different inputs are never compared against each other.
+    """
+    return f"{year}/day{day:02d}@{hash_input_file(input_path)[:16]}"
+
+
+def write_results(results: dict, path) -> None:
+    """Writes benchmark results as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    logger.info("Wrote benchmark results to %s", path)
+
+
+def read_results(path) -> dict:
+    """Reads benchmark results written by `write_results`."""
+    return json.loads(Path(path).read_text())
+
+
+def find_regressions(
+    results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    Compares results against a baseline and describes every regression.
+
+    A stage regresses when its median time or peak memory exceeds the
+    baseline's by more than `threshold` (a fraction, e.g. 0.1 for 10%).
+    Stages missing from the baseline, including every stage of a day whose
+    input differs from the baseline's, are skipped.
+    """
+    regressions = []
+    for key, stages in results.items():
+        for stage, measurement in stages.items():
+            baseline_measurement = baseline.get(key, {}).get(stage)
+            if baseline_measurement is None:
+                continue
+            for metric in ("median", "peak_memory"):
+                current = measurement[metric]
+                previous = baseline_measurement[metric]
+                if previous and current > previous * (1 + threshold):
+                    regressions.append(
+                        f"{key} {stage} {metric}: {previous:g} -> {current:g} "
+                        f"(+{(current / previous - 1) * 100:.1f}%)"
+                    )
+    return regressions
+
+
+def log_day_benchmark(key: str, stages: dict[str, dict[str, float]]) -> None:
+    for stage, measurement in stages.items():
+        logger.info(
+            "%s %s -- median %.3f ms, p95 %.3f ms, peak memory %d bytes",
+            key,
+            stage,
+            measurement["median"] * 1000,
+            measurement["p95"] * 1000,
+            measurement["peak_memory"],
+        )
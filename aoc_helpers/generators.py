@@ -0,0 +1,214 @@
+import logging
+import random
+from pathlib import Path
+
+from aoc_helpers.parse_cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+GENERATED_INPUT_DIR = DEFAULT_CACHE_DIR / "generated"
+
+MAX_DIAL_ROTATION = 10**9
+MAX_PRODUCT_ID = 10**18
+MAX_PRODUCT_ID_RANGE_WIDTH = 10**15
+BATTERY_BANK_COUNT = 200
+PAPER_ROLL_DENSITY = 0.7
+MAX_INGREDIENT_ID = 10**15
+MAX_INGREDIENT_RANGE_WIDTH = 10**12
+WORKSHEET_NUMBER_ROWS = 4
+SPLITTER_DENSITY = 0.5
+JUNCTION_BOX_COORDINATE_LIMIT = 100_000
+RED_TILE_COORDINATE_LIMIT = 100_000
+
+
+def log_uniform_int(rng: random.Random, upper: int) -> int:
+    """Draws an int in [1, upper] whose order of magnitude is uniformly distributed."""
+    return min(upper, max(1, int(upper ** rng.random())))
+
+
+def generate_dial_rotations(size: int, rng: random.Random) -> str:
+    """2025 day01: `size` rotations of up to MAX_DIAL_ROTATION clicks."""
+    rotations = [
+        f"{rng.choice('LR')}{log_uniform_int(rng, MAX_DIAL_ROTATION)}"
+        for _ in range(size)
+    ]
+    return "\n".join(rotations)
+
+
+def generate_product_id_ranges(size: int, rng: random.Random) -> str:
+    """2025 day02: `size` disjoint ranges, each spanning up to 10^15 IDs."""
+    max_span = max(1, min(MAX_PRODUCT_ID_RANGE_WIDTH, MAX_PRODUCT_ID // (2 * size)))
+    ranges = []
+    start = 1
+    for _ in range(size):
+        start += rng.randrange(max_span)
+        end = start + log_uniform_int(rng, max_span) - 1
+        ranges.append(f"{start}-{end}")
+        start = end + 2
+    return ",".join(ranges)
+
+
+def generate_battery_banks(size: int, rng: random.Random) -> str:
+    """2025 day03: BATTERY_BANK_COUNT banks of `size` joltage digits each."""
+    digits = "123456789"
+    banks = ["".join(rng.choices(digits, k=size)) for _ in range(BATTERY_BANK_COUNT)]
+    return "\n".join(banks)
+
+
+def generate_paper_roll_grid(size: int, rng: random.Random) -> str:
+    """2025 day04: a `size` x `size` grid of paper rolls."""
+    rows = [
+        "".join("@" if rng.random() < PAPER_ROLL_DENSITY else "." for _ in range(size))
+        for _ in range(size)
+    ]
+    return "\n".join(rows)
+
+
+def generate_ingredient_database(size: int, rng: random.Random) -> str:
+    """
+    2025 day05: `size` possibly overlapping fresh ranges followed by `size` IDs.
+
+    Range widths shrink as `size` grows so the ranges cover about the same
+    share of the ID space at every size instead of merging into a few.
+    """
+    max_width = max(1, min(MAX_INGREDIENT_RANGE_WIDTH, MAX_INGREDIENT_ID // size))
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, MAX_INGREDIENT_ID)
+        width = log_uniform_int(rng, max_width)
+        end = min(MAX_INGREDIENT_ID, start + width)
+        ranges.append(f"{start}-{end}")
+    ingredient_ids = [str(rng.randint(1, MAX_INGREDIENT_ID)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredient_ids)
+
+
+def generate_math_worksheet(size: int, rng: random.Random) -> str:
+    """2025 day06: `size` problems of WORKSHEET_NUMBER_ROWS numbers side by side."""
+    rows = [[] for _ in range(WORKSHEET_NUMBER_ROWS + 1)]
+    for problem in range(size):
+        numbers = [
+            str(log_uniform_int(rng, 9999)) for _ in range(WORKSHEET_NUMBER_ROWS)
+        ]
+        if problem == 0:
+            # The reader strips leading whitespace, so the first row must
+            # start at the very first column
+            numbers[0] = numbers[0].rjust(max(map(len, numbers)), "9")
+        width = max(len(number) for number in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def generate_tachyon_manifold(size: int, rng: random.Random) -> str:
+    """
+    2025 day07: a `size` x `size` manifold with splitters on every other row.
+
+    Like the real inputs, the splitter rows alternate column parity so beams
+    leaving one splitter row can hit the next, and no two splitters are ever
+    adjacent.
+    """
+    start_column = size // 2
+    rows = ["." * start_column + "S" + "." * (size - start_column - 1)]
+    for row_index in range(1, size):
+        if row_index % 2:
+            rows.append("." * size)
+        else:
+            rows.append(
+                "".join(
+                    "^"
+                    if 0 < column < size - 1
+                    and column % 2 == (start_column + row_index // 2 - 1) % 2
+                    and rng.random() < SPLITTER_DENSITY
+                    else "."
+                    for column in range(size)
+                )
+            )
+    return "\n".join(rows)
+
+
+def generate_junction_box_positions(size: int, rng: random.Random) -> str:
+    """2025 day08: `size` junction boxes scattered through a cube."""
+    limit = JUNCTION_BOX_COORDINATE_LIMIT
+    boxes = [
+        f"{rng.randrange(limit)},{rng.randrange(limit)},{rng.randrange(limit)}"
+        for _ in range(size)
+    ]
+    return "\n".join(boxes)
+
+
+def generate_red_tile_polygon(size: int, rng: random.Random) -> str:
+    """
+    2025 day09: a simple rectilinear polygon with about `size` vertices.
+
+    The polygon is x-monotone: a staircase along the top from left to right
+    and another along the bottom back to the start, so it never crosses
+    itself and consecutive tiles always share a row or column.
+    """
+    steps = max(2, size // 4 + 1)
+    limit = RED_TILE_COORDINATE_LIMIT
+    xs = sorted(rng.sample(range(limit), steps))
+    middle = limit // 2
+
+    def staircase_heights(low: int, high: int) -> list[int]:
+        heights = [rng.randrange(low, high)]
+        while len(heights) < steps - 1:
+            height = rng.randrange(low, high)
+            if height != heights[-1]:
+                heights.append(height)
+        return heights
+
+    tops = staircase_heights(middle + 1, limit)
+    bottoms = staircase_heights(0, middle)
+
+    tiles = []
+    for index, top in enumerate(tops):
+        tiles.append((xs[index], top))
+        tiles.append((xs[index + 1], top))
+    for index in reversed(range(steps - 1)):
+        tiles.append((xs[index + 1], bottoms[index]))
+        tiles.append((xs[index], bottoms[index]))
+    return "\n".join(f"{x},{y}" for x, y in tiles)
+
+
+GENERATORS = {
+    (2025, 1): generate_dial_rotations,
+    (2025, 2): generate_product_id_ranges,
+    (2025, 3): generate_battery_banks,
+    (2025, 4): generate_paper_roll_grid,
+    (2025, 5): generate_ingredient_database,
+    (2025, 6): generate_math_worksheet,
+    (2025, 7): generate_tachyon_manifold,
+    (2025, 8): generate_junction_box_positions,
+    (2025, 9): generate_red_tile_polygon,
+}
+
+
+def generate_input(year: int, day: int, size: int, seed: int = 0) -> str:
+    """Generates a deterministic input of the given size for a puzzle."""
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day:02d}")
+    return GENERATORS[(year, day)](size, random.Random(seed))
+
+
+def write_generated_input(
+    year: int, day: int, size: int, seed: int = 0, directory=GENERATED_INPUT_DIR
+) -> Path:
+    """
+    Writes a generated input to `directory` and returns its path.
+
+    Inputs are reused when the same year, day, size and seed were generated
+    before.
+    """
+    path = Path(directory, f"{year}-day{day:02d}-size{size}-seed{seed}.txt")
+    if path.exists():
+        logger.info("Reusing generated input: %s", path)
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    input_text = generate_input(year, day, size, seed)
+    temporary_path = path.with_suffix(".tmp")
+    temporary_path.write_text(input_text + "\n")
+    temporary_path.replace(path)
+    logger.info("Generated %d bytes of input: %s", len(input_text), path)
+    return path
@@ -1,16 +1,118 @@
+import gzip
 import logging
+import mmap
+from pathlib import Path
+from array import array
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class MappedInput:
+    """
+    A zero-copy view of a memory-mapped input file.
+
+    `data` is a read-only memoryview with surrounding whitespace trimmed, the
+    same trimming `read_input_to_str` applies, and `line_offsets` holds the
+    offset in `data` where each line starts. Nothing is decoded or copied.
+    Compressed inputs cannot be mapped, so for those `data` views the
+    decompressed bytes instead.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes):
+        self._buffer = buffer
+        self._start, self._end = self._find_trimmed_bounds(buffer)
+        self.data = memoryview(buffer)[self._start : self._end]
+        self.line_offsets = self._index_lines()
+
+    @staticmethod
+    def _find_trimmed_bounds(buffer: mmap.mmap | bytes) -> tuple[int, int]:
+        """Finds the bounds of the buffer with leading/trailing whitespace removed."""
+        start, end = 0, len(buffer)
+        while start < end and buffer[start] in ASCII_WHITESPACE:
+            start += 1
+        while end > start and buffer[end - 1] in ASCII_WHITESPACE:
+            end -= 1
+        return start, end
+
+    def _index_lines(self) -> array:
+        """Records the start offset of every line, relative to `data`."""
+        offsets = array("Q")
+        if self._start == self._end:
+            return offsets
+        offsets.append(0)
+        position = self._buffer.find(b"\n", self._start, self._end)
+        while position != -1:
+            offsets.append(position + 1 - self._start)
+            position = self._buffer.find(b"\n", position + 1, self._end)
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.line_offsets)
+
+    def line(self, index: int) -> memoryview:
+        """Returns a single line as a memoryview, without its line terminator."""
+        start = self.line_offsets[index]
+        if index + 1 < len(self.line_offsets):
+            end = self.line_offsets[index + 1] - 1
+        else:
+            end = len(self.data)
+        if end > start and self.data[end - 1] == ord("\r"):
+            end -= 1
+        return self.data[start:end]
+
+    def lines(self):
+        """Yields every line as a memoryview."""
+        for index in range(len(self.line_offsets)):
+            yield self.line(index)
+
+    def close(self) -> None:
+        """Releases the view and unmaps the file."""
+        self.data.release()
+        if not isinstance(self._buffer, mmap.mmap):
+            return
+        try:
+            self._buffer.close()
+        except BufferError:
+            # A caller still holds a slice of `data`; the mapping is closed
+            # once that slice is garbage collected
+            logger.debug("Deferring unmap of input with live views")
+
+
+def _open_zstd(file_path, mode, **kwargs):
+    """Opens a zstd-compressed file, importing the codec only when needed."""
+    from compression import zstd
+
+    return zstd.open(file_path, mode, **kwargs)
+
+
+COMPRESSED_OPENERS = {
+    ".gz": gzip.open,
+    ".zst": _open_zstd,
+}
+
 
 class AocInputReader:
     def __init__(self, file_path):
         self.file_path = file_path
 
+    @property
+    def is_compressed(self):
+        """Whether the input file is gzip or zstd compressed, judged by its suffix"""
+        return Path(self.file_path).suffix in COMPRESSED_OPENERS
+
+    def _open(self, mode, **kwargs):
+        """Opens the input file, decompressing it incrementally when compressed."""
+        opener = COMPRESSED_OPENERS.get(Path(self.file_path).suffix, open)
+        return opener(self.file_path, mode, **kwargs)
+
     def read_input_to_str(self):
         """Reads and returns the input file as a stripped UTF-8 string"""
         logger.info("Reading input: %s", self.file_path)
-        with open(self.file_path, "rb") as file:
+        with self._open("rb") as file:
             raw = file.read()
         logger.info("Read %d bytes from %s", len(raw), self.file_path)
         data = raw.decode("utf-8").strip()
@@ -22,3 +124,100 @@ class AocInputReader:
         lines = input_text.splitlines()
         logger.info("Split input into %d lines", len(lines))
         return lines
+
+    def iter_lines(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields the lines of the input file from fixed-size chunked reads.
+
+        Produces the same lines as `read_input_to_lines` without holding the
+        whole text or the whole list in memory.
+        """
+        held_line = None
+        blank_lines = []
+        for line in self._iter_split_chunks("\n", chunk_size):
+            line = line.removesuffix("\r")
+            if not line.strip():
+                if held_line is not None:
+                    blank_lines.append(line)
+                continue
+            if held_line is None:
+                line = line.lstrip()
+            else:
+                yield held_line
+                yield from blank_lines
+                blank_lines.clear()
+            held_line = line
+        if held_line is not None:
+            yield held_line.rstrip()
+
+    def iter_records(self, separator, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yields the stripped, non-empty records of the input file split on
+        `separator`, e.g. "," for comma-separated ranges or "\n\n" for
+        blank-line separated sections.
+        """
+        for record in self._iter_split_chunks(separator, chunk_size):
+            record = record.strip()
+            if record:
+                yield record
+
+    def _iter_split_chunks(self, separator, chunk_size):
+        """
+        Splits the decoded input on `separator` one chunk at a time.
+
+        Only the new chunk, plus the last len(separator) - 1 characters before
+        it, is searched for the separator, and an unfinished record is kept as
+        a list of pieces, so long records cost linear time.
+        """
+        logger.info("Streaming input: %s", self.file_path)
+        overlap = len(separator) - 1
+        pending_pieces = []
+        # The unfinished record's last characters, which may start a separator
+        carry = ""
+        for chunk in self._iter_text_chunks(chunk_size):
+            text = carry + chunk
+            start = 0
+            while (index := text.find(separator, start)) != -1:
+                pending_pieces.append(text[start:index])
+                yield "".join(pending_pieces)
+                pending_pieces.clear()
+                start = index + len(separator)
+            carry_start = max(start, len(text) - overlap)
+            if carry_start > start:
+                pending_pieces.append(text[start:carry_start])
+            carry = text[carry_start:]
+        pending_pieces.append(carry)
+        yield "".join(pending_pieces)
+
+    def _iter_text_chunks(self, chunk_size):
+        """Yields the input file as decoded text chunks of `chunk_size` characters."""
+        with self._open("rt", encoding="utf-8", newline="") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    @contextmanager
+    def map_input(self):
+        """Memory-maps the input file and yields it as a MappedInput"""
+        if self.is_compressed:
+            logger.info("Decompressing input for mapping: %s", self.file_path)
+            with self._open("rb") as file:
+                buffer = file.read()
+        else:
+            logger.info("Mapping input: %s", self.file_path)
+            with open(self.file_path, "rb") as file:
+                try:
+                    buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    buffer = b""
+        mapped_input = MappedInput(buffer)
+        logger.info(
+            "Mapped %d bytes (%d lines) from %s",
+            len(mapped_input.data),
+            len(mapped_input),
+            self.file_path,
+        )
+        try:
+            yield mapped_input
+        finally:
+            mapped_input.close()
@@ -0,0 +1,140 @@
+import hashlib
+import itertools
+import logging
+import os
+import struct
+from array import array
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", ".aoc_cache"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+CACHE_MAGIC = b"AOCP"
+CACHE_SUFFIX = ".bin"
+HEADER = struct.Struct("<4sI")
+TABLE_HEADER = struct.Struct("<BIQ")
+FLAT_TABLE = 0
+ROW_TABLE = 1
+
+
+def encode_parsed_input(parsed) -> bytes:
+    """
+    Encodes parsed input as a compact binary blob.
+
+    Supported structures are a table, or a tuple of tables, where a table is
+    either a list of ints or a list of equal-length tuples of ints. Each table
+    is stored as a flat signed 64-bit array. Raises TypeError for anything
+    else and OverflowError for ints that do not fit in 64 bits.
+    """
+    tables = parsed if isinstance(parsed, tuple) else (parsed,)
+    chunks = [HEADER.pack(CACHE_MAGIC, len(tables))]
+    for table in tables:
+        if not isinstance(table, list):
+            raise TypeError(f"Cannot cache parsed value of type {type(table).__name__}")
+        if table and isinstance(table[0], tuple):
+            width = len(table[0])
+            if any(len(row) != width for row in table):
+                raise TypeError("Cannot cache rows of differing widths")
+            values = array("q", itertools.chain.from_iterable(table))
+            chunks.append(TABLE_HEADER.pack(ROW_TABLE, width, len(table)))
+        else:
+            values = array("q", table)
+            chunks.append(TABLE_HEADER.pack(FLAT_TABLE, 1, len(table)))
+        chunks.append(values.tobytes())
+    return b"".join(chunks)
+
+
+def decode_parsed_input(blob: bytes, as_tuple: bool):
+    """Decodes a blob written by `encode_parsed_input`."""
+    magic, table_count = HEADER.unpack_from(blob)
+    if magic != CACHE_MAGIC:
+        raise ValueError("Not a parsed input cache file")
+    offset = HEADER.size
+    tables = []
+    for _ in range(table_count):
+        kind, width, rows = TABLE_HEADER.unpack_from(blob, offset)
+        offset += TABLE_HEADER.size
+        values = array("q")
+        size = width * rows * values.itemsize
+        values.frombytes(blob[offset : offset + size])
+        offset += size
+        if kind == ROW_TABLE:
+            tables.append(list(zip(*[iter(values)] * width)))
+        else:
+            tables.append(values.tolist())
+    if as_tuple:
+        return tuple(tables)
+    return tables[0]
+
+
+def hash_input_file(file_path) -> str:
+    """Returns the SHA-256 hex digest of the input file's raw contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParsedInputCache:
+    """
+    A directory of parsed inputs keyed by input content hash and parser version.
+
+    Entries are evicted least-recently-used first (by file mtime, which is
+    refreshed on every hit) once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, input_reader, parser, version) -> Path:
+        digest = hash_input_file(input_reader.file_path)
+        entry_name = f"{parser.__name__}-v{version}-{digest[:32]}{CACHE_SUFFIX}"
+        return self.cache_dir / entry_name
+
+    def load_or_parse(self, input_reader, parser, version=1, as_tuple=False):
+        """
+        Returns `parser(input_text)` for the reader's input, loading it from the
+        cache when the same input was parsed by the same parser version before.
+
+        Set `as_tuple` when the parser returns a tuple of tables. Bump `version`
+        whenever the parser's output changes.
+        """
+        entry_path = self._entry_path(input_reader, parser, version)
+        if entry_path.exists():
+            logger.info("Loading parsed input from cache: %s", entry_path)
+            parsed = decode_parsed_input(entry_path.read_bytes(), as_tuple)
+            os.utime(entry_path)
+            return parsed
+
+        parsed = parser(input_reader.read_input_to_str())
+        try:
+            blob = encode_parsed_input(parsed)
+        except (TypeError, OverflowError) as error:
+            logger.warning("Not caching parsed input: %s", error)
+            return parsed
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temporary_path = entry_path.with_suffix(".tmp")
+        temporary_path.write_bytes(blob)
+        os.replace(temporary_path, entry_path)
+        logger.info("Cached parsed input (%d bytes): %s", len(blob), entry_path)
+        self.evict()
+        return parsed
+
+    def evict(self) -> None:
+        """Deletes least recently used entries until the cache fits in `max_bytes`."""
+        entries = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in self.cache_dir.glob(f"*{CACHE_SUFFIX}")
+        ]
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            logger.info("Evicting cached parsed input: %s", entry)
+            entry.unlink(missing_ok=True)
+            total_bytes -= size
@@ -0,0 +1,183 @@
+import importlib.util
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc_helpers.input_reader import AocInputReader
+
+logger = logging.getLogger(__name__)
+
+INPUT_FILE_NAME = "input.txt"
+SOLUTION_FILE_NAME = "solution.py"
+SOLUTION_STAGES = ("parse_input", "solve_part1", "solve_part2")
+# Optional stage a day defines to load its parsed input through ParsedInputCache
+CACHED_PARSE_STAGE = "parse_cached_input"
+
+
+@dataclass
+class DayResult:
+    year: int
+    day: int
+    part1: object = None
+    part2: object = None
+    timings: dict[str, float] = field(default_factory=dict)
+    cpu_time: float = 0.0
+
+
+def day_directory(root, year: int, day: int) -> Path:
+    """Returns the YEAR/dayNN directory for a puzzle."""
+    return Path(root, str(year), f"day{day:02d}")
+
+
+def discover_days(root, year: int) -> list[int]:
+    """Finds every day of a year that has a solution module."""
+    year_directory = Path(root, str(year))
+    days = []
+    for solution_path in year_directory.glob(f"day[0-9][0-9]/{SOLUTION_FILE_NAME}"):
+        days.append(int(solution_path.parent.name.removeprefix("day")))
+    return sorted(days)
+
+
+def load_solution_module(root, year: int, day: int):
+    """Imports YEAR/dayNN/solution.py and checks it exposes the runner stages."""
+    solution_path = day_directory(root, year, day) / SOLUTION_FILE_NAME
+    if not solution_path.is_file():
+        raise FileNotFoundError(f"No solution found at {solution_path}")
+
+    module_name = f"aoc_{year}_day{day:02d}"
+    spec = importlib.util.spec_from_file_location(module_name, solution_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    missing_stages = [stage for stage in SOLUTION_STAGES if not hasattr(module, stage)]
+    if missing_stages:
+        raise AttributeError(
+            f"{solution_path} does not define {', '.join(missing_stages)}"
+        )
+    return module
+
+
+def run_day(root, year: int, day: int, input_path=None, parts=(1, 2)) -> DayResult:
+    """
+    Runs one day's solution, timing the read, parse and part stages separately.
+
+    Only the parts listed in `parts` are solved. Days that define
+    `parse_cached_input(input_reader)` load their parsed input through it
+    instead; that stage reads the input itself, so it is reported as "load"
+    in place of "read" and "parse".
+    """
+    cpu_start = time.process_time()
+    module = load_solution_module(root, year, day)
+    if input_path is None:
+        input_path = day_directory(root, year, day) / INPUT_FILE_NAME
+
+    result = DayResult(year, day)
+    input_reader = AocInputReader(input_path)
+
+    if hasattr(module, CACHED_PARSE_STAGE):
+        start = time.perf_counter()
+        parsed = getattr(module, CACHED_PARSE_STAGE)(input_reader)
+        result.timings["load"] = time.perf_counter() - start
+    else:
+        start = time.perf_counter()
+        input_text = input_reader.read_input_to_str()
+        result.timings["read"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parsed = module.parse_input(input_text)
+        result.timings["parse"] = time.perf_counter() - start
+
+    if 1 in parts:
+        start = time.perf_counter()
+        result.part1 = module.solve_part1(parsed)
+        result.timings["part1"] = time.perf_counter() - start
+
+    if 2 in parts:
+        start = time.perf_counter()
+        result.part2 = module.solve_part2(parsed)
+        result.timings["part2"] = time.perf_counter() - start
+
+    result.cpu_time = time.process_time() - cpu_start
+    return result
+
+
+def merge_day_results(results: list[DayResult]) -> DayResult:
+    """
+    Combines results for the same day that were solved part by part.
+
+    Read and parse timings come from the first result; every worker repeated
+    those stages, so their CPU time is still counted in full.
+    """
+    merged = DayResult(results[0].year, results[0].day)
+    for result in results:
+        if result.part1 is not None:
+            merged.part1 = result.part1
+        if result.part2 is not None:
+            merged.part2 = result.part2
+        for stage, seconds in result.timings.items():
+            merged.timings.setdefault(stage, seconds)
+        merged.cpu_time += result.cpu_time
+    return merged
+
+
+def run_days_in_parallel(
+    root,
+    year: int,
+    days: list[int],
+    input_paths: dict[int, Path] | None = None,
+    max_workers: int | None = None,
+    split_parts: bool = False,
+) -> list[DayResult]:
+    """
+    Runs several days in a process pool, one worker task per day.
+
+    `input_paths` maps a day to the input to use instead of its input.txt.
+    With `split_parts`, each part is dispatched as its own task so the two
+    parts of a slow day run concurrently (each task reads and parses the
+    input itself).
+    """
+    input_paths = input_paths or {}
+    part_groups = ((1,), (2,)) if split_parts else ((1, 2),)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures_by_day = {
+            day: [
+                executor.submit(
+                    run_day, root, year, day, input_paths.get(day), parts
+                )
+                for parts in part_groups
+            ]
+            for day in days
+        }
+        return [
+            merge_day_results([future.result() for future in futures])
+            for futures in futures_by_day.values()
+        ]
+
+
+def log_day_result(result: DayResult) -> None:
+    """Logs a day's answers and stage timings."""
+    stage_timings = ", ".join(
+        f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in result.timings.items()
+    )
+    logger.info(
+        "%d day %02d -- Part 1: %s, Part 2: %s (%s)",
+        result.year,
+        result.day,
+        result.part1,
+        result.part2,
+        stage_timings,
+    )
+
+
+def log_run_summary(results: list[DayResult], wall_time: float) -> None:
+    """Logs the total wall time of a run against the CPU time it consumed."""
+    cpu_time = sum(result.cpu_time for result in results)
+    logger.info(
+        "Ran %d day(s) in %.3f s wall time using %.3f s CPU time (%.2fx)",
+        len(results),
+        wall_time,
+        cpu_time,
+        cpu_time / wall_time if wall_time else 0.0,
+    )
@@ -11,6 +11,49 @@ DIR="$YEAR/day$DAY_PAD"
 
 mkdir -p "$DIR"
 : > "$DIR/input.txt"
-: > "$DIR/solution.py"
+
+if [ -s "$DIR/solution.py" ]; then
+  echo "Keeping existing $DIR/solution.py"
+else
+  # The runner (python -m aoc_helpers run) requires these stage functions
+  cat > "$DIR/solution.py" <<'SOLUTION'
+from aoc_helpers.input_reader import AocInputReader
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+INPUT_FILE_NAME = "input.txt"
+
+
+def parse_input(input_text: str) -> list[str]:
+    return input_text.splitlines()
+
+
+def solve_part1(lines: list[str]):
+    return None
+
+
+def solve_part2(lines: list[str]):
+    return None
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    aoc_input_reader = AocInputReader(Path(__file__).parent / INPUT_FILE_NAME)
+    lines = parse_input(aoc_input_reader.read_input_to_str())
+
+    logger.info("Part 1 Solution -- %s", solve_part1(lines))
+    logger.info("Part 2 Solution -- %s", solve_part2(lines))
+
+
+if __name__ == "__main__":
+    main()
+SOLUTION
+fi
 
 echo "Created $DIR/input.txt and $DIR/solution.py"
\ No newline at end of file